@@ -3,14 +3,42 @@ Agent package - Simple agent creation
 
 Import and use:
     from agent import get_filesystem_agent, get_multi_server_agent
+    from Agent import get_or_create_agent, close_cached_agents  # shared per-process agents
+    from Agent import prune_memory  # trim a long-lived conversation thread
 
 All agents use RICH display mode by default.
+
+The factory and memory modules are loaded lazily on first attribute access, so
+`import Agent` does not pull in the LLM and MCP stacks.
 """
 
-from .agent_factory import (
-    get_multi_server_agent,
-)
+import importlib
+
+_LAZY_ATTRS = {
+    "get_multi_server_agent": ".agent_factory",
+    "get_or_create_agent": ".agent_factory",
+    "close_cached_agents": ".agent_factory",
+    "prune_memory": ".agent_memory",
+}
 
 __all__ = [
     "get_multi_server_agent",
-]
\ No newline at end of file
+    "get_or_create_agent",
+    "close_cached_agents",
+    "prune_memory",
+]
+
+
+def __getattr__(name):
+    """Import factory functions on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,17 +2,44 @@
 Agent Factory - Simple agent creation functions
 
 All functions return ready-to-use LangGraph agents with RICH display mode.
+
+Heavy dependencies (LLM, mcp_conductor, Client) are imported inside the
+factory functions so that importing this module stays cheap.
+
+`get_or_create_agent` keeps one initialized agent per server selection and
+agent settings for the life of the event loop, so scripts that run one
+after another on the same loop reuse the warm MCP server subprocesses and
+LLM client. Call `close_cached_agents()` once, before the event loop exits.
 """
 
-from typing import Dict, Optional
-from LLM import get_gemini_llm
-from mcp_conductor import LangGraphAgent, StreamDisplayMode
-from Client import create_multi_server_client, create_filesystem_client
+import asyncio
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from mcp_conductor import LangGraphAgent, StreamDisplayMode
+
+# Agents and their sessions belong to the loop that created them; a new
+# loop (another asyncio.run) starts with an empty cache and its own lock
+_agents: Dict[Tuple, "LangGraphAgent"] = {}
+_agents_loop: Optional[asyncio.AbstractEventLoop] = None
+_agents_lock: Optional[asyncio.Lock] = None
+
+
+def _loop_lock() -> asyncio.Lock:
+    """Lock guarding _agents on the running loop, resetting the cache when the loop changed."""
+    global _agents_loop, _agents_lock
+    loop = asyncio.get_running_loop()
+    if loop is not _agents_loop:
+        _agents.clear()
+        _agents_loop = loop
+        _agents_lock = asyncio.Lock()
+    return _agents_lock
+
 
 def get_multi_server_agent(
         server_selections: Dict[str, bool],
         max_steps: int = 500
-) -> LangGraphAgent:
+) -> "LangGraphAgent":
     """
     Get agent with selected MCP servers.
 
@@ -29,6 +56,10 @@ def get_multi_server_agent(
             "my_custom_server": True
         })
     """
+    from LLM import get_gemini_llm
+    from mcp_conductor import LangGraphAgent, StreamDisplayMode
+    from Client import create_multi_server_client
+
     llm = get_gemini_llm()
     client = create_multi_server_client(server_selections)
 
@@ -40,3 +71,88 @@ def get_multi_server_agent(
         auto_print_streaming=True,
         memory_enabled=True
     )
+
+
+async def get_or_create_agent(
+        server_selections: Dict[str, bool],
+        *,
+        mode: Optional["StreamDisplayMode"] = None,
+        max_steps: int = 20,
+        verbose: bool = False
+) -> "LangGraphAgent":
+    """
+    Get a shared, initialized agent for the selected MCP servers.
+
+    The first call for a selection and settings starts its server sessions
+    while the LLM client is built; later identical calls on the same event
+    loop return the same agent. Do not use the agent as an async context
+    manager, since leaving it closes the shared sessions.
+
+    The agent gets exactly the servers selected True, and every one of them
+    must connect; the manager's enabled servers are left unchanged.
+
+    Args:
+        server_selections: Dict of server_name -> enabled
+        mode: Stream display mode (RICH when omitted)
+        max_steps: Maximum execution steps
+        verbose: Whether the agent logs verbosely
+
+    Returns:
+        LangGraphAgent: Initialized agent with selected tools
+
+    Raises:
+        ValueError: If no server is selected or a selected one is unknown
+    """
+    from LLM import get_gemini_llm
+    from mcp_conductor import LangGraphAgent, StreamDisplayMode
+    from Client import get_server_manager
+
+    mode = mode or StreamDisplayMode.RICH
+    # The agent gets exactly the selected servers, so the key fully describes
+    # it; settings are part of the key so one caller never changes another's agent
+    server_names = frozenset(name for name, enabled in server_selections.items() if enabled)
+    if not server_names:
+        raise ValueError("No MCP servers selected")
+    key = (server_names, mode, max_steps, verbose)
+
+    async with _loop_lock():
+        agent = _agents.get(key)
+        if agent is None:
+            client = get_server_manager().create_client_for_servers(server_names)
+            # A shared agent missing a selected server would quietly lack its tools
+            client.require_all_servers = True
+            try:
+                _, llm = await asyncio.gather(
+                    client.create_all_sessions(),
+                    asyncio.to_thread(get_gemini_llm)
+                )
+                agent = LangGraphAgent(
+                    llm=llm,
+                    client=client,
+                    max_steps=max_steps,
+                    stream_display_mode=mode,
+                    auto_print_streaming=True,
+                    memory_enabled=True,
+                    verbose=verbose
+                )
+                await agent.initialize()
+            except BaseException:
+                await client.close_all_sessions()
+                raise
+            _agents[key] = agent
+
+    return agent
+
+
+async def close_cached_agents() -> None:
+    """Close every agent created by get_or_create_agent and stop its MCP servers."""
+    from Client import shutdown_servers
+
+    async with _loop_lock():
+        agents = list(_agents.values())
+        _agents.clear()
+
+    for agent in agents:
+        await agent.close()
+    # Closing an agent only parks its sessions in the pool; this ends the subprocesses
+    await shutdown_servers()
@@ -0,0 +1,58 @@
+"""
+Agent Memory - keep a long-lived conversation thread bounded
+
+With `memory_enabled=True` every query is appended to the agent's
+LangGraph thread and the whole history is sent with the next one, so
+prompt size grows with every turn. `prune_memory` drops the oldest turns
+from the checkpointed thread before a new query, keeping roughly the last
+`keep_messages` messages.
+
+Whole turns are kept: the cut is moved back to a user message, so a tool
+call is never separated from its result.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mcp_conductor import LangGraphAgent
+
+logger = logging.getLogger(__name__)
+
+
+async def prune_memory(agent: "LangGraphAgent", keep_messages: int = 8) -> int:
+    """
+    Remove the oldest messages from the agent's current conversation thread.
+
+    Args:
+        agent: Initialized LangGraph agent
+        keep_messages: Approximate number of recent messages to keep
+
+    Returns:
+        int: Number of messages removed (0 when memory is off or nothing to trim)
+    """
+    graph = getattr(agent, "_langgraph_agent", None)
+    if graph is None or not getattr(agent, "memory_enabled", False):
+        return 0
+
+    from langchain_core.messages import HumanMessage, RemoveMessage
+
+    config = {"configurable": {"thread_id": agent.thread_id}}
+    try:
+        snapshot = await graph.aget_state(config)
+        messages = snapshot.values.get("messages", [])
+        if len(messages) <= keep_messages:
+            return 0
+
+        cut = len(messages) - keep_messages
+        while cut > 0 and not isinstance(messages[cut], HumanMessage):
+            cut -= 1
+
+        stale = [RemoveMessage(id=message.id) for message in messages[:cut] if message.id]
+        if stale:
+            await graph.aupdate_state(config, {"messages": stale})
+        return len(stale)
+    except Exception as e:
+        # Trimming is an optimization; a failure only means a longer prompt
+        logger.debug(f"Could not prune agent memory: {e}")
+        return 0
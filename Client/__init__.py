@@ -7,14 +7,17 @@ Main functions:
 - create_filesystem_client(): Get client with only filesystem
 - add_custom_server(): Add your custom MCP servers
 - create_multi_server_client(): Get client with selected servers
+- create_multi_server_client_async(): Same, with servers connected concurrently
 - list_available_servers(): List all available servers
 - print_server_status(): Show current server status
+- shutdown_servers(): Stop the MCP servers kept alive for reuse
 """
 
 from .mcp_connectors import (
     # Core client creation
     create_filesystem_client,
     create_multi_server_client,
+    create_multi_server_client_async,
 
     # Custom server management
     add_custom_server,
@@ -23,6 +26,7 @@ from .mcp_connectors import (
     list_available_servers,
     print_server_status,
     get_server_manager,
+    shutdown_servers,
 
     # Selection management
     get_server_selection_dict,
@@ -34,13 +38,18 @@ from .mcp_connectors import (
 
     # Core classes (if needed)
     MCPServerManager,
-    MCPServerConfig
+    MCPServerConfig,
+    ConcurrentMCPClient,
+    ServerRow,
+    ToolCatalogCache,
+    MCPConnectionPool
 )
 
 __all__ = [
     # Main client functions
     "create_filesystem_client",
     "create_multi_server_client",
+    "create_multi_server_client_async",
 
     # Server management
     "add_custom_server",
@@ -49,6 +58,7 @@ __all__ = [
     "list_available_servers",
     "print_server_status",
     "get_server_manager",
+    "shutdown_servers",
 
     # Selection utilities
     "get_server_selection_dict",
@@ -60,5 +70,9 @@ __all__ = [
 
     # Classes
     "MCPServerManager",
-    "MCPServerConfig"
+    "MCPServerConfig",
+    "ConcurrentMCPClient",
+    "ServerRow",
+    "ToolCatalogCache",
+    "MCPConnectionPool"
 ]
\ No newline at end of file
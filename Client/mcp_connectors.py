@@ -4,14 +4,68 @@ MCP Client Manager for MCP-Tools-Demo
 Simple MCP server management with filesystem default and custom server addition.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import sys
+import threading
+import time
+import warnings
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+from dataclasses import dataclass, field
 from mcp_conductor import MCPClient
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# Base arguments for the filesystem MCP server; allowed directories are appended
+_FS_BASE_ARGS = ("-y", "@modelcontextprotocol/server-filesystem")
+
+
+@lru_cache(maxsize=1)
+def _cached_cwd() -> str:
+    """Working directory at first use, cached to avoid repeated getcwd calls."""
+    return os.getcwd()
+
+
+# How many MCP servers are connected at the same time
+_DEFAULT_CONNECT_CONCURRENCY = 5
+
+# Circuit breaker: skip a server after this many failed connects in a row,
+# then let one attempt through again once the cooldown has passed
+_BREAKER_FAILURE_THRESHOLD = 2
+_BREAKER_COOLDOWN = 600.0  # seconds
+
+# Last-seen tool lists per server command line (see ToolCatalogCache)
+_TOOL_CATALOG_FILE = os.path.join(os.path.expanduser("~"), ".cache", "mcp_conductor", "tools.json")
+
+# Idle server sessions are kept this long for reuse (see MCPConnectionPool)
+_POOL_IDLE_TTL = 600.0  # seconds
+
+
+# Lightweight row for server listings (see iter_servers_for_selection)
+ServerRow = namedtuple("ServerRow", "name description enabled command")
+
+
+@dataclass(slots=True)
+class HealthState:
+    """Connect health of one server (circuit breaker state)."""
+    consecutive_failures: int = 0
+    last_failure_ts: float = 0.0
+    state: str = "closed"  # "closed", "open" or "half_open"
+    last_error: Optional[str] = None
+
+
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for an MCP server."""
     name: str
@@ -20,62 +74,412 @@ class MCPServerConfig:
     env: Dict[str, str]
     description: str
     enabled: bool = False
+    _cmd_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _dict_frag: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def command_str(self) -> str:
+        """Full command line, joined once and cached until invalidated."""
+        if self._cmd_str is None:
+            self._cmd_str = f"{self.command} {' '.join(self.args)}"
+        return self._cmd_str
+
+    def as_mcp_dict(self) -> Dict[str, Any]:
+        """Server entry for an "mcpServers" config, built once and cached until invalidated."""
+        if self._dict_frag is None:
+            self._dict_frag = {
+                "command": self.command,
+                "args": list(self.args),
+                "env": dict(self.env)
+            }
+        return self._dict_frag
+
+    def invalidate_cache(self):
+        """Drop cached derived values after command, args or env change."""
+        self._cmd_str = None
+        self._dict_frag = None
+
+
+class ToolCatalogCache:
+    """Disk cache of the tools each MCP server reported on its last connect.
+
+    Entries are keyed by a hash of the server's command, args and env, so
+    a changed configuration never gets an old catalog. The file is read
+    lazily on first use and rewritten atomically only when a catalog changes.
+    """
+
+    def __init__(self, path: str = _TOOL_CATALOG_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def signature(server_config: Dict[str, Any]) -> str:
+        """Stable key for a {command, args, env} server entry."""
+        raw = json.dumps(
+            [server_config["command"], list(server_config["args"]), sorted((server_config.get("env") or {}).items())]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "rb") as f:
+                    data = f.read()
+                self._entries = orjson.loads(data) if orjson else json.loads(data)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _dump(self):
+        entries = self._entries or {}
+        data = orjson.dumps(entries) if orjson else json.dumps(entries).encode("utf-8")
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def get(self, server_config: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Tools last seen for this server entry, or None if never connected."""
+        with self._lock:
+            entry = self._load().get(self.signature(server_config))
+        return entry["tools"] if entry else None
+
+    def update(self, server_config: Dict[str, Any], tools: List[Dict[str, Any]]):
+        """Record the tools a server just reported."""
+        key = self.signature(server_config)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and entry["tools"] == tools:
+                return
+
+            entries[key] = {"tools": tools, "updated_at": time.time()}
+            try:
+                self._dump()
+            except OSError:
+                pass  # The catalog is only a cache
+
+
+class MCPConnectionPool:
+    """Keeps initialized server sessions alive between clients for reuse.
+
+    Sessions are keyed by the server signature (command, args, env) and
+    checked out exclusively: acquire() hands out an idle session or connects a
+    new one, release() parks it again. A session only works on the event loop
+    that opened it, so it is only reused on that loop. Idle sessions older
+    than `idle_ttl` are closed whenever the pool is used.
+    """
+
+    def __init__(self, idle_ttl: float = _POOL_IDLE_TTL):
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        # signature -> [(session, loop, released_at), ...]
+        self._idle: Dict[str, List[tuple]] = {}
+
+    def _take_expired(self, loop: asyncio.AbstractEventLoop, ttl: float) -> List[Any]:
+        """Drop stale entries; return the sessions that must be disconnected on `loop`."""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for signature in list(self._idle):
+                kept = []
+                for entry in self._idle[signature]:
+                    session, session_loop, released_at = entry
+                    if session_loop.is_closed():
+                        continue  # Its subprocess went away with the loop
+                    if session_loop is loop and now - released_at >= ttl:
+                        expired.append(session)
+                        continue
+                    kept.append(entry)
+                if kept:
+                    self._idle[signature] = kept
+                else:
+                    del self._idle[signature]
+        return expired
+
+    async def _disconnect(self, sessions: Iterable[Any]):
+        for session in sessions:
+            try:
+                await session.disconnect()
+            except Exception:
+                pass
+
+    async def acquire(self, signature: str, factory):
+        """Return an idle session for `signature`, or await `factory()` for a new one."""
+        loop = asyncio.get_running_loop()
+        await self._disconnect(self._take_expired(loop, self.idle_ttl))
+
+        with self._lock:
+            entries = self._idle.get(signature, [])
+            for i, (session, session_loop, _) in enumerate(entries):
+                if session_loop is loop and session.is_connected:
+                    del entries[i]
+                    return session
+
+        return await factory()
+
+    async def release(self, signature: str, session: Any):
+        """Park a session for reuse; sessions that lost their connection are closed."""
+        if not session.is_connected:
+            await self._disconnect([session])
+            return
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._idle.setdefault(signature, []).append((session, loop, time.monotonic()))
+
+    async def close_idle(self, max_idle: Optional[float] = None):
+        """Close sessions on the running loop idle for `max_idle` (default idle_ttl; 0 closes all)."""
+        ttl = self.idle_ttl if max_idle is None else max_idle
+        await self._disconnect(self._take_expired(asyncio.get_running_loop(), ttl))
+
+    async def close_all(self):
+        """Disconnect every parked session on the running loop, stopping its server."""
+        await self.close_idle(0)
+
+    def idle_count(self) -> int:
+        """Number of parked sessions."""
+        with self._lock:
+            return sum(len(entries) for entries in self._idle.values())
+
+
+class ConcurrentMCPClient(MCPClient):
+    """MCPClient that connects to its servers concurrently.
+
+    LangGraphAgent.initialize() calls create_all_sessions(); connecting in
+    parallel bounds startup by the slowest servers instead of the sum of all
+    of them. Servers that already have a session, or already failed to
+    connect on this client, are skipped, so a client warmed up by
+    create_client_from_selection_async() is not reconnected and each server
+    gets one connect attempt (and one circuit breaker record) per client.
+    With a connection_pool set, closed sessions are parked in the pool and
+    picked up again by the next client using the same server.
+    """
+
+    concurrency: int = _DEFAULT_CONNECT_CONCURRENCY
+    tool_catalog: Optional[ToolCatalogCache] = None
+    connection_pool: Optional[MCPConnectionPool] = None
+    # Receives connect results (see MCPServerManager.record_connect_result)
+    health_monitor: Optional["MCPServerManager"] = None
+    # When False, servers that fail to connect are logged and left out as long
+    # as one server connects; when True, any failure fails the whole client
+    require_all_servers: bool = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Servers whose connect failed on this client. They are not retried, so
+        # initialize() after a warm-up connect never records the failure twice
+        self._failed: Dict[str, Exception] = {}
+
+    async def _record_tools(self, server_name: str, session):
+        if session is None or self.tool_catalog is None:
+            return
+        with warnings.catch_warnings():
+            # Tools were just listed by initialize(), so they are fresh here
+            warnings.simplefilter("ignore", DeprecationWarning)
+            tools = session.connector.tools
+        # The catalog file is rewritten off the loop
+        await asyncio.to_thread(
+            self.tool_catalog.update,
+            self.config["mcpServers"][server_name],
+            [tool.model_dump(mode="json", exclude_none=True) for tool in tools]
+        )
+
+    async def create_session(self, server_name: str, auto_initialize: bool = True):
+        """Create a session, reusing a pooled one for the same server if available."""
+        servers = self.config.get("mcpServers", {})
+        if self.connection_pool is None or not auto_initialize or server_name not in servers:
+            session = await super().create_session(server_name, auto_initialize)
+            if auto_initialize:
+                await self._record_tools(server_name, session)
+            return session
+
+        async def connect():
+            session = await super(ConcurrentMCPClient, self).create_session(server_name, True)
+            await self._record_tools(server_name, session)
+            return session
+
+        signature = ToolCatalogCache.signature(servers[server_name])
+        session = await self.connection_pool.acquire(signature, connect)
+
+        self.sessions[server_name] = session
+        if server_name not in self.active_sessions:
+            self.active_sessions.append(server_name)
+        return session
+
+    async def close_session(self, server_name: str):
+        """Close a session; pooled clients hand it back to the pool instead."""
+        servers = self.config.get("mcpServers", {})
+        if self.connection_pool is None or server_name not in self.sessions or server_name not in servers:
+            return await super().close_session(server_name)
+
+        session = self.sessions.pop(server_name)
+        if server_name in self.active_sessions:
+            self.active_sessions.remove(server_name)
+        await self.connection_pool.release(ToolCatalogCache.signature(servers[server_name]), session)
+
+    def cached_tools(self, server_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Tools the server reported last time it was connected, without connecting."""
+        if self.tool_catalog is None:
+            return None
+        return self.tool_catalog.get(self.config["mcpServers"][server_name])
+
+    async def create_all_sessions(self, auto_initialize: bool = True):
+        """Create sessions for all configured servers, `concurrency` at a time."""
+        servers = self.config.get("mcpServers", {})
+        if not servers:
+            return await super().create_all_sessions(auto_initialize)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        errors = self._failed
+
+        async def connect(server_name: str):
+            async with semaphore:
+                try:
+                    await self.create_session(server_name, auto_initialize)
+                except Exception as e:
+                    errors[server_name] = e
+                    logger.warning(f"MCP server '{server_name}' failed to connect: {e}")
+                    if self.health_monitor is not None:
+                        self.health_monitor.record_connect_result(server_name, e)
+                else:
+                    if self.health_monitor is not None:
+                        self.health_monitor.record_connect_result(server_name)
+
+        await asyncio.gather(*(connect(name) for name in servers
+                               if name not in self.sessions and name not in errors))
+
+        if errors and self.require_all_servers:
+            error = next(iter(errors.values()))
+            raise RuntimeError(f"Failed to connect to MCP servers: {', '.join(errors)}") from error
+        # Otherwise one broken server should not take the others down with it
+        if errors and not self.sessions:
+            error = next(iter(errors.values()))
+            raise RuntimeError(f"Failed to connect to any MCP server ({', '.join(errors)})") from error
+        return self.sessions
 
 
 class MCPServerManager:
-    """Manages MCP servers with filesystem default and custom additions."""
+    """Manages MCP servers with filesystem default and custom additions.
+
+    All mutations go through an internal re-entrant lock so the shared
+    manager can be used from several threads creating agents at once.
+    """
 
     def __init__(self):
         """Initialize with ONLY filesystem server as default."""
         self.servers: Dict[str, MCPServerConfig] = {}
+        self._enabled_names: set[str] = set()
+        self._lock = threading.RLock()
+        # Signature of the last selection applied by set_server_selections;
+        # cleared by any other mutation so a repeated selection is re-applied
+        self._last_selection_sig: Optional[frozenset] = None
+        # Bumped by every mutation (see version)
+        self._version = 0
+        self.tool_catalog = ToolCatalogCache()
+        self.connection_pool = MCPConnectionPool()
+        self._health: Dict[str, HealthState] = {}
         self._load_filesystem_default()
 
     def _load_filesystem_default(self):
         """Load ONLY filesystem server as default."""
-        current_dir = str(Path.cwd())
         self.servers["filesystem"] = MCPServerConfig(
             name="filesystem",
             command="npx",
-            args=["-y", "@modelcontextprotocol/server-filesystem", current_dir],
+            args=[*_FS_BASE_ARGS, _cached_cwd()],
             env={},
             description="File system operations - read, write, list files and directories",
             enabled=True  # Only default enabled
         )
+        self._enabled_names.add("filesystem")
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every change to the servers or their state.
+
+        Callers caching something derived from the manager (e.g. an encoded
+        server list) store it with the version and rebuild when it moves.
+        """
+        return self._version
 
     def get_available_servers(self) -> Dict[str, MCPServerConfig]:
-        """Get all available server configurations."""
-        return self.servers.copy()
+        """Get a snapshot of all server configurations, copied under the lock."""
+        with self._lock:
+            return dict(self.servers)
 
     def get_enabled_servers(self) -> Dict[str, MCPServerConfig]:
-        """Get only enabled server configurations."""
-        return {name: config for name, config in self.servers.items() if config.enabled}
+        """Get only enabled server configurations, in the order the servers were added."""
+        with self._lock:
+            # Walk the ordered servers dict, not the set: set order varies with
+            # the hash seed, and this order reaches the agent's tool list
+            enabled_names = self._enabled_names
+            return {name: config for name, config in self.servers.items() if name in enabled_names}
+
+    def get_server_selections(self) -> Dict[str, bool]:
+        """Get a snapshot of every server's enabled flag, copied under the lock."""
+        with self._lock:
+            return {name: name in self._enabled_names for name in self.servers}
 
     def enable_server(self, server_name: str) -> bool:
         """Enable a server."""
-        if server_name in self.servers:
-            self.servers[server_name].enabled = True
-            return True
-        return False
+        with self._lock:
+            if server_name in self.servers:
+                self.servers[server_name].enabled = True
+                self._enabled_names.add(server_name)
+                self._last_selection_sig = None
+                self._version += 1
+                return True
+            return False
 
     def disable_server(self, server_name: str) -> bool:
         """Disable a server."""
-        if server_name in self.servers:
-            self.servers[server_name].enabled = False
-            return True
-        return False
+        with self._lock:
+            if server_name in self.servers:
+                self.servers[server_name].enabled = False
+                self._enabled_names.discard(server_name)
+                self._health.pop(server_name, None)
+                self._last_selection_sig = None
+                self._version += 1
+                return True
+            return False
 
     def toggle_server(self, server_name: str) -> bool:
         """Toggle server enabled state."""
-        if server_name in self.servers:
-            self.servers[server_name].enabled = not self.servers[server_name].enabled
-            return self.servers[server_name].enabled
-        return False
+        with self._lock:
+            if server_name in self.servers:
+                if self.servers[server_name].enabled:
+                    self.disable_server(server_name)
+                else:
+                    self.enable_server(server_name)
+                return self.servers[server_name].enabled
+            return False
 
     def set_server_selections(self, server_selections: Dict[str, bool]):
         """Set multiple server enabled states."""
-        for server_name, enabled in server_selections.items():
-            if server_name in self.servers:
-                self.servers[server_name].enabled = enabled
+        sig = frozenset(server_selections.items())
+
+        with self._lock:
+            if sig == self._last_selection_sig:
+                return  # Same selection as last time and nothing changed since
+
+            # Unknown names are skipped by the key intersection; unchanged ones are left alone
+            for server_name in self.servers.keys() & server_selections.keys():
+                config = self.servers[server_name]
+                enabled = server_selections[server_name]
+                if config.enabled == enabled:
+                    continue
+
+                config.enabled = enabled
+                if enabled:
+                    self._enabled_names.add(server_name)
+                else:
+                    self._enabled_names.discard(server_name)
+                self._version += 1
+
+            self._last_selection_sig = sig
 
     def add_custom_server(
         self,
@@ -87,74 +491,271 @@ class MCPServerManager:
         enabled: bool = False
     ) -> bool:
         """Add a custom MCP server configuration."""
-        if name in self.servers:
-            return False  # Server already exists
+        with self._lock:
+            if name in self.servers:
+                return False  # Server already exists
+
+            self.servers[name] = MCPServerConfig(
+                name=name,
+                command=command,
+                args=args,
+                env=env or {},
+                description=description,
+                enabled=enabled
+            )
+            if enabled:
+                self._enabled_names.add(name)
+            self._last_selection_sig = None
+            self._version += 1
+            return True
 
-        self.servers[name] = MCPServerConfig(
-            name=name,
-            command=command,
-            args=args,
-            env=env or {},
-            description=description,
-            enabled=enabled
-        )
-        return True
+    def add_custom_servers_bulk(self, configs: Iterable[MCPServerConfig]) -> int:
+        """
+        Add several custom server configurations in one step.
+
+        Names that already exist are skipped, like add_custom_server().
+
+        Returns:
+            int: Number of servers actually added
+        """
+        with self._lock:
+            new_servers: Dict[str, MCPServerConfig] = {}
+            for config in configs:
+                if config.name not in self.servers:
+                    new_servers.setdefault(config.name, config)
+
+            self.servers.update(new_servers)
+            self._enabled_names.update(name for name, config in new_servers.items() if config.enabled)
+            if new_servers:
+                self._last_selection_sig = None
+                self._version += 1
+            return len(new_servers)
 
     def remove_server(self, server_name: str) -> bool:
         """Remove a server configuration (except filesystem)."""
         if server_name == "filesystem":
             return False  # Can't remove filesystem default
 
-        if server_name in self.servers:
-            del self.servers[server_name]
-            return True
-        return False
+        with self._lock:
+            if server_name in self.servers:
+                del self.servers[server_name]
+                self._enabled_names.discard(server_name)
+                self._last_selection_sig = None
+                self._version += 1
+                return True
+            return False
 
     def update_filesystem_directories(self, directories: List[str]):
         """Update filesystem server with new directories."""
-        if "filesystem" in self.servers:
-            self.servers["filesystem"].args = ["-y", "@modelcontextprotocol/server-filesystem"] + directories
+        with self._lock:
+            if "filesystem" in self.servers:
+                self.servers["filesystem"].args = list(_FS_BASE_ARGS) + directories
+                self.servers["filesystem"].invalidate_cache()
+                self._version += 1
 
     def create_client_from_selection(self) -> MCPClient:
-        """Create MCP client with currently enabled servers."""
-        enabled_servers = self.get_enabled_servers()
+        """Create MCP client with currently enabled servers.
+
+        Every call returns a new client: an agent closes its client's sessions
+        when it is closed, so a shared client would break the other agents.
+        Each server's config entry is cached on its MCPServerConfig.
+        """
+        # Snapshot under the lock; client creation happens outside it
+        with self._lock:
+            if not self._enabled_names:
+                # If nothing enabled, enable filesystem by default
+                self.enable_server("filesystem")
+
+            enabled_servers = self.get_enabled_servers()
+            now = time.time()
+            healthy = {name: config for name, config in enabled_servers.items() if self._breaker_allows(name, now)}
+            if healthy:
+                # If every server is tripped, try them all rather than start with none
+                enabled_servers = healthy
+            fragments = {name: config.as_mcp_dict() for name, config in enabled_servers.items()}
+
+        return self._client_from_fragments(fragments)
+
+    def create_client_for_servers(self, server_names: Iterable[str]) -> MCPClient:
+        """Create MCP client with exactly the named servers.
+
+        Unlike create_client_from_selection, the manager's enabled servers are
+        neither read nor changed, and circuit breakers do not drop any server.
+
+        Raises:
+            ValueError: If a name is not a configured server
+        """
+        wanted = set(server_names)
+        with self._lock:
+            unknown = wanted - self.servers.keys()
+            if unknown:
+                raise ValueError(f"Unknown MCP servers: {', '.join(sorted(unknown))}")
+            # In the order the servers were added, like get_enabled_servers
+            fragments = {name: config.as_mcp_dict() for name, config in self.servers.items() if name in wanted}
+
+        return self._client_from_fragments(fragments)
+
+    def _client_from_fragments(self, fragments: Dict[str, Dict[str, Any]]) -> MCPClient:
+        # fragments is a new outer dict per call, since add_server/remove_server mutate it
+        client = ConcurrentMCPClient.from_dict({"mcpServers": fragments})
+        client.tool_catalog = self.tool_catalog
+        client.connection_pool = self.connection_pool
+        client.health_monitor = self
+        return client
+
+    def _breaker_allows(self, server_name: str, now: float) -> bool:
+        """Whether a server may be connected; moves open breakers to half-open after the cooldown."""
+        health = self._health.get(server_name)
+        if health is None or health.state != "open":
+            return True
+        if now - health.last_failure_ts > _BREAKER_COOLDOWN:
+            health.state = "half_open"
+            self._version += 1
+            return True
+        return False
 
-        if not enabled_servers:
-            # If nothing enabled, enable filesystem by default
-            self.enable_server("filesystem")
-            enabled_servers = {"filesystem": self.servers["filesystem"]}
+    def record_connect_result(self, server_name: str, error: Optional[BaseException] = None):
+        """Update a server's circuit breaker after a connect attempt."""
+        with self._lock:
+            health = self._health.get(server_name)
+            if health is None:
+                health = self._health[server_name] = HealthState()
+            previous_state = health.state
+
+            if error is None:
+                health.consecutive_failures = 0
+                health.state = "closed"
+                health.last_error = None
+            else:
+                health.consecutive_failures += 1
+                health.last_failure_ts = time.time()
+                health.last_error = str(error)
+                if health.state == "half_open" or health.consecutive_failures >= _BREAKER_FAILURE_THRESHOLD:
+                    health.state = "open"
+
+            if health.state != previous_state:
+                self._version += 1
+
+    def health_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get connect health for every configured server.
+
+        Returns:
+            Dict mapping server name to state, consecutive_failures,
+            last_failure_ts and last_error
+        """
+        with self._lock:
+            now = time.time()
+            report = {}
+            for name in self.servers:
+                health = self._health.get(name) or HealthState()
+                # Read-only: an open breaker past its cooldown is reported as
+                # half_open, but only a connect attempt actually moves it there
+                state = health.state
+                if state == "open" and now - health.last_failure_ts > _BREAKER_COOLDOWN:
+                    state = "half_open"
+                report[name] = {
+                    "state": state,
+                    "consecutive_failures": health.consecutive_failures,
+                    "last_failure_ts": health.last_failure_ts or None,
+                    "last_error": health.last_error
+                }
+            return report
+
+    async def shutdown(self):
+        """Stop the MCP servers whose sessions are parked in the connection pool.
+
+        Closing a pooled client only parks its sessions, so call this once
+        the clients are closed (e.g. at process exit) to end the subprocesses.
+        """
+        await self.connection_pool.close_all()
+
+    def get_cached_tools(self, server_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the tools a server reported on its last connect, without connecting.
+
+        Returns:
+            List of tool definitions (name, description, inputSchema), or None
+            if the server has not been connected with its current configuration
+        """
+        with self._lock:
+            if server_name not in self.servers:
+                return None
+            server_entry = self.servers[server_name].as_mcp_dict()
+        return self.tool_catalog.get(server_entry)
+
+    async def create_client_from_selection_async(
+        self,
+        concurrency: int = _DEFAULT_CONNECT_CONCURRENCY
+    ) -> MCPClient:
+        """Create MCP client and connect all enabled servers concurrently.
 
-        config = {"mcpServers": {}}
+        Args:
+            concurrency: Maximum number of servers connecting at the same time
 
-        for name, server_config in enabled_servers.items():
-            config["mcpServers"][name] = {
-                "command": server_config.command,
-                "args": server_config.args,
-                "env": server_config.env
-            }
+        Returns:
+            MCPClient: Client with a live session for every enabled server
+        """
+        client = self.create_client_from_selection()
+        client.concurrency = concurrency
+        await client.create_all_sessions()
+        return client
 
-        return MCPClient.from_dict(config)
+    def iter_servers_for_selection(self) -> Iterator[ServerRow]:
+        """Iterate servers as ServerRow tuples, without building per-server dicts.
+
+        The rows are a snapshot taken under the lock, so they agree with each
+        other even if the servers change while they are being consumed.
+        """
+        with self._lock:
+            rows = [ServerRow(config.name, config.description, config.enabled, config.command_str)
+                    for config in self.servers.values()]
+
+        yield from rows
 
     def list_servers_for_selection(self) -> List[Dict[str, Any]]:
         """Get servers in format suitable for selection UI."""
-        return [
-            {
-                "name": name,
-                "description": config.description,
-                "enabled": config.enabled,
-                "command": f"{config.command} {' '.join(config.args)}"
-            }
-            for name, config in self.servers.items()
-        ]
+        return [row._asdict() for row in self.iter_servers_for_selection()]
 
 
-# Global manager instance
-_server_manager = MCPServerManager()
+# Templates for print_server_status
+_STATUS_HEADER = "\n📋 Available MCP Servers\n═══════════════════════════"
+_STATUS_ENTRY = "{status} {name}\n   📝 {description}\n   🔧 {command}\n"
+_STATUS_FOOTER = "📊 Total: {total} servers, {enabled} enabled"
+
+
+# Global manager instance, created on first use (see get_server_manager)
+_server_manager_lock = threading.Lock()
 
 
 def get_server_manager() -> MCPServerManager:
-    """Get the global server manager instance."""
-    return _server_manager
+    """Get the global server manager instance.
+
+    Built on the first call and shared afterwards, so callers can call this
+    freely instead of holding on to the result.
+    """
+    manager = globals().get("_server_manager")
+    if manager is None:
+        with _server_manager_lock:
+            manager = globals().get("_server_manager")
+            if manager is None:
+                manager = globals()["_server_manager"] = MCPServerManager()
+    return manager
+
+
+async def shutdown_servers():
+    """Stop every pooled MCP server of the global manager, if it was ever built."""
+    manager = globals().get("_server_manager")
+    if manager is not None:
+        await manager.shutdown()
+
+
+def __getattr__(name: str):
+    # Keeps `from Client.mcp_connectors import _server_manager` working without
+    # building the manager (and resolving the CWD) at import time
+    if name == "_server_manager":
+        return get_server_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_filesystem_client(allowed_directories: Optional[List[str]] = None) -> MCPClient:
@@ -169,13 +770,13 @@ def create_filesystem_client(allowed_directories: Optional[List[str]] = None) ->
         MCPClient: Configured client with filesystem server
     """
     if allowed_directories is None:
-        allowed_directories = [str(Path.cwd())]
+        allowed_directories = [_cached_cwd()]
 
     config = {
         "mcpServers": {
             "filesystem": {
                 "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-filesystem"] + allowed_directories,
+                "args": list(_FS_BASE_ARGS) + allowed_directories,
                 "env": {}
             }
         }
@@ -244,6 +845,35 @@ def create_multi_server_client(server_selections: Optional[Dict[str, bool]] = No
     return manager.create_client_from_selection()
 
 
+async def create_multi_server_client_async(
+    server_selections: Optional[Dict[str, bool]] = None,
+    concurrency: int = _DEFAULT_CONNECT_CONCURRENCY
+) -> MCPClient:
+    """
+    Create MCP client with selected servers and connect them concurrently.
+
+    Args:
+        server_selections: Dict of server_name -> enabled status.
+                          If None, uses current manager selections.
+        concurrency: Maximum number of servers connecting at the same time
+
+    Returns:
+        MCPClient: Client with a live session for every selected server
+
+    Example:
+        client = await create_multi_server_client_async({
+            "filesystem": True,
+            "playwright": True
+        })
+    """
+    manager = get_server_manager()
+
+    if server_selections:
+        manager.set_server_selections(server_selections)
+
+    return await manager.create_client_from_selection_async(concurrency)
+
+
 def list_available_servers() -> List[Dict[str, Any]]:
     """
     List all available MCP servers.
@@ -258,20 +888,22 @@ def list_available_servers() -> List[Dict[str, Any]]:
 def print_server_status():
     """Print current server status."""
     manager = get_server_manager()
-    servers = manager.list_servers_for_selection()
 
-    print(f"\n📋 Available MCP Servers")
-    print(f"═══════════════════════════")
+    lines = [_STATUS_HEADER]
+    enabled = 0
+    for server in manager.iter_servers_for_selection():
+        enabled += server.enabled
+        lines.append(_STATUS_ENTRY.format(
+            status="✅" if server.enabled else "⬜",
+            name=server.name,
+            description=server.description,
+            command=server.command
+        ))
+    total = len(lines) - 1
+    lines.append(_STATUS_FOOTER.format(total=total, enabled=enabled))
 
-    for server in servers:
-        status = "✅" if server["enabled"] else "⬜"
-        print(f"{status} {server['name']}")
-        print(f"   📝 {server['description']}")
-        print(f"   🔧 {server['command']}")
-        print()
-
-    enabled_count = sum(1 for s in servers if s["enabled"])
-    print(f"📊 Total: {len(servers)} servers, {enabled_count} enabled")
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Quick setup functions for common use cases
@@ -296,14 +928,17 @@ def setup_with_custom_servers(*custom_servers) -> MCPClient:
     manager = get_server_manager()
 
     # Add custom servers
-    for name, command, args, description in custom_servers:
-        manager.add_custom_server(
+    manager.add_custom_servers_bulk([
+        MCPServerConfig(
             name=name,
             command=command,
             args=args,
+            env={},
             description=description,
             enabled=True
         )
+        for name, command, args, description in custom_servers
+    ])
 
     return manager.create_client_from_selection()
 
@@ -312,8 +947,7 @@ def setup_with_custom_servers(*custom_servers) -> MCPClient:
 
 def get_server_selection_dict() -> Dict[str, bool]:
     """Get current server selections as dict for UI."""
-    manager = get_server_manager()
-    return {name: config.enabled for name, config in manager.get_available_servers().items()}
+    return get_server_manager().get_server_selections()
 
 
 def apply_server_selections(selections: Dict[str, bool]):
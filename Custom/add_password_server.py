@@ -4,11 +4,18 @@ Password Server Integration for MCP-Tools-Demo
 Easy integration of the custom password manager MCP server.
 """
 
+import os
 import sys
 from pathlib import Path
 
+# Paths resolved once at import
+_CUSTOM_DIR = Path(__file__).parent
+_PROJECT_ROOT = str(_CUSTOM_DIR.parent)
+_SERVER_SCRIPT = str(_CUSTOM_DIR / "password_server.py")
+
 # Add parent directory to path for Client imports
-sys.path.append(str(Path(__file__).parent.parent))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from Client import add_custom_server, get_server_manager
 
@@ -30,17 +37,13 @@ def add_password_server(enabled: bool = False) -> bool:
         # Add and enable password server
         add_password_server(enabled=True)
     """
-    # Get the path to the password server script
-    custom_dir = Path(__file__).parent
-    server_script = custom_dir / "password_server.py"
-
-    if not server_script.exists():
-        raise FileNotFoundError(f"Password server script not found: {server_script}")
+    if not os.path.exists(_SERVER_SCRIPT):
+        raise FileNotFoundError(f"Password server script not found: {_SERVER_SCRIPT}")
 
     success = add_custom_server(
         name="password_manager",
         command="python",
-        args=[str(server_script)],
+        args=[_SERVER_SCRIPT],
         env={},
         description="Password management - generate, save, encrypt/decrypt passwords securely",
         enabled=enabled
@@ -83,12 +86,9 @@ def get_password_server_config() -> dict:
     Returns:
         dict: Server configuration
     """
-    custom_dir = Path(__file__).parent
-    server_script = custom_dir / "password_server.py"
-
     return {
         "command": "python",
-        "args": [str(server_script)],
+        "args": [_SERVER_SCRIPT],
         "env": {}
     }
 
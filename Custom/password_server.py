@@ -9,23 +9,46 @@ A secure MCP server for password management with:
 - list_passwords: List all saved password entries
 - delete_password: Delete a saved password entry
 
-Uses Fernet encryption for secure password storage.
+Uses AES-256-GCM encryption for secure password storage (entries written
+by older versions with Fernet are still readable).
 """
 
 import asyncio
+import difflib
 import json
+import os
 import secrets
 import string
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Tuple
 import base64
 from datetime import datetime
+from functools import lru_cache
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import Resource, Tool, TextContent, ImageContent, EmbeddedResource
 import mcp.types as types
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; list_passwords loads the whole store without it
+    ijson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional; tool arguments are not validated here without it
+    fastjsonschema = None
 
 # Server instance
 server = Server("password-manager")
@@ -34,421 +57,752 @@ server = Server("password-manager")
 STORAGE_FILE = Path.home() / ".mcp_passwords.json"
 KEY_FILE = Path.home() / ".mcp_password_key"
 
+# Single-entry changes are appended here and folded into STORAGE_FILE
+# once the journal holds this many records
+JOURNAL_FILE = Path.home() / ".mcp_passwords.journal"
+_JOURNAL_COMPACT_THRESHOLD = 256
+_journal_records = 0
+
+# (stamp of STORAGE_FILE and JOURNAL_FILE, passwords) from the last load or
+# write; load_passwords reuses it while neither file has changed on disk
+_CACHE: Tuple[tuple, Dict[str, Any]] | None = None
+
+
+# Character classes for generate_password
+_LOWER = string.ascii_lowercase
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
+_SYMBOLS = "!@#$%^&*()-_=+[]{}|;:,.<>?"
+
+# Shared CSPRNG instance; SystemRandom keeps no state worth re-creating
+_SYSRAND = secrets.SystemRandom()
+
+# Full charset for every combination of enabled classes, keyed by a bitmask
+# of (lowercase=1, uppercase=2, numbers=4, symbols=8)
+_CHARSETS: Dict[int, str] = {
+    mask: "".join(chars for bit, chars in enumerate((_LOWER, _UPPER, _DIGITS, _SYMBOLS)) if mask & (1 << bit))
+    for mask in range(16)
+}
+
+# Stored AES-GCM values are this prefix + urlsafe base64(nonce + ciphertext + tag)
+_GCM_PREFIX = "gcm1:"
+_GCM_NONCE_SIZE = 12
+_GCM_KEY_INFO = b"mcp-password-manager/aes-256-gcm"
+
+# Every Fernet token starts with the base64 of its 0x80 version byte
+_FERNET_TOKEN_PREFIX = b"gAAAAA"
+
+# Key and ciphers are read/built once per process
+_KEY: bytes | None = None
+_FERNET: Fernet | None = None
+_AESGCM: AESGCM | None = None
+
 
 def get_or_create_key() -> bytes:
     """Get or create encryption key."""
+    global _KEY
+    if _KEY is not None:
+        return _KEY
+
     if KEY_FILE.exists():
-        return KEY_FILE.read_bytes()
-    else:
-        key = Fernet.generate_key()
-        KEY_FILE.write_bytes(key)
-        KEY_FILE.chmod(0o600)  # Owner read/write only
-        print(f"🔐 Created new encryption key at {KEY_FILE}")
-        return key
+        _KEY = KEY_FILE.read_bytes()
+        return _KEY
+
+    key = Fernet.generate_key()
+    try:
+        # O_EXCL: never overwrite a key another process just created
+        _write_private_file(KEY_FILE, key, os.O_EXCL)
+    except FileExistsError:
+        _KEY = KEY_FILE.read_bytes()
+        return _KEY
+    print(f"🔐 Created new encryption key at {KEY_FILE}")
+    _KEY = key
+    return _KEY
+
+
+def _write_private_file(path: Path, data: bytes, flags: int = os.O_TRUNC, fsync: bool = False):
+    """Write `data` to `path`, creating the file owner read/write only (0o600).
+
+    The mode is applied by open() itself, so the file is never readable by
+    others, not even briefly; umask can only narrow it further.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | flags, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _get_fernet() -> Fernet:
+    """Get the cached Fernet cipher for the encryption key."""
+    global _FERNET
+    if _FERNET is None:
+        _FERNET = Fernet(get_or_create_key())
+    return _FERNET
+
+
+def _get_aesgcm() -> AESGCM:
+    """Get the cached AES-256-GCM cipher.
+
+    Its key is derived with HKDF from the existing key file, so stores
+    created with Fernet keep working with the same key.
+    """
+    global _AESGCM
+    if _AESGCM is None:
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_GCM_KEY_INFO)
+        _AESGCM = AESGCM(hkdf.derive(base64.urlsafe_b64decode(get_or_create_key())))
+    return _AESGCM
 
 
 def encrypt_password(password: str) -> str:
-    """Encrypt password using Fernet."""
-    key = get_or_create_key()
-    f = Fernet(key)
-    encrypted = f.encrypt(password.encode('utf-8'))
-    return base64.b64encode(encrypted).decode('utf-8')
+    """Encrypt password using AES-256-GCM."""
+    nonce = os.urandom(_GCM_NONCE_SIZE)
+    sealed = _get_aesgcm().encrypt(nonce, password.encode('utf-8'), None)
+    return _GCM_PREFIX + base64.urlsafe_b64encode(nonce + sealed).decode('ascii')
 
 
 def decrypt_password(encrypted_password: str) -> str:
-    """Decrypt password using Fernet."""
-    key = get_or_create_key()
-    f = Fernet(key)
-    encrypted_bytes = base64.b64decode(encrypted_password.encode('utf-8'))
-    decrypted = f.decrypt(encrypted_bytes)
-    return decrypted.decode('utf-8')
+    """Decrypt password (AES-256-GCM, or Fernet for older entries)."""
+    if encrypted_password.startswith(_GCM_PREFIX):
+        raw = base64.urlsafe_b64decode(encrypted_password[len(_GCM_PREFIX):])
+        nonce, sealed = raw[:_GCM_NONCE_SIZE], raw[_GCM_NONCE_SIZE:]
+        return _get_aesgcm().decrypt(nonce, sealed, None).decode('utf-8')
+
+    token = encrypted_password.encode('ascii')
+    if not token.startswith(_FERNET_TOKEN_PREFIX):
+        # Entries saved by older versions wrapped the token in another base64 layer
+        token = base64.b64decode(token)
+    return _get_fernet().decrypt(token).decode('utf-8')
+
+
+def _store_stamp() -> tuple:
+    """Identify the current on-disk state of the store and its journal."""
+    stamps = []
+    for path in (STORAGE_FILE, JOURNAL_FILE):
+        try:
+            st = os.stat(path)
+            stamps.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
 
 
 def load_passwords() -> Dict[str, Any]:
-    """Load passwords from storage file."""
-    if not STORAGE_FILE.exists():
-        return {}
+    """Load passwords from storage file, replaying any journaled changes.
 
+    The result is cached until either file changes on disk; callers that
+    modify it must persist the change with commit_password_change().
+    """
+    global _journal_records, _CACHE
+    stamp = _store_stamp()
+    if _CACHE is not None and _CACHE[0] == stamp:
+        return _CACHE[1]
+
+    passwords = {}
+
+    if STORAGE_FILE.exists():
+        try:
+            data = STORAGE_FILE.read_bytes()
+            passwords = orjson.loads(data) if orjson else json.loads(data)
+        except (ValueError, FileNotFoundError):
+            passwords = {}
+
+    records = 0
+    for record in _iter_journal():
+        if record["op"] == "put":
+            passwords[record["service"]] = record["entry"]
+        else:
+            passwords.pop(record["service"], None)
+        records += 1
+
+    _journal_records = records
+    _CACHE = (stamp, passwords)
+    return passwords
+
+
+def _iter_journal() -> Iterator[Dict[str, Any]]:
+    """Yield journal records, oldest first."""
     try:
-        with open(STORAGE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
+        with open(JOURNAL_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    yield orjson.loads(line) if orjson else json.loads(line)
+                except ValueError:
+                    continue  # Torn write from an interrupted append
+    except FileNotFoundError:
+        return
+
+
+def _without_secret(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in entry.items() if key != "encrypted_password"}
+
+
+def iter_password_metadata() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (service, entry) for every saved password, without encrypted_password.
+
+    With ijson installed the storage file is streamed one entry at a time
+    instead of being parsed whole; journaled changes are applied on the way.
+    The (secret-free) entries are buffered until the stream ends, so an
+    unreadable store falls back to load_passwords() instead of yielding a
+    partial list.
+    """
+    if ijson is None or (_CACHE is not None and _CACHE[0] == _store_stamp()):
+        for service, entry in load_passwords().items():
+            yield service, _without_secret(entry)
+        return
+
+    # service -> latest journaled entry, or None if it was deleted
+    pending: Dict[str, Any] = {}
+    for record in _iter_journal():
+        pending[record["service"]] = record["entry"] if record["op"] == "put" else None
+
+    streamed = []
+    try:
+        with open(STORAGE_FILE, 'rb') as f:
+            for service, entry in ijson.kvitems(f, '', use_float=True):
+                if service in pending:
+                    entry = pending.pop(service)
+                    if entry is None:
+                        continue
+                streamed.append((service, _without_secret(entry)))
+    except FileNotFoundError:
+        pass
+    except ijson.JSONError:
+        # Unreadable store: load_passwords treats it as empty and still replays the journal
+        for service, entry in load_passwords().items():
+            yield service, _without_secret(entry)
+        return
+
+    yield from streamed
+    for service, entry in pending.items():
+        if entry is not None:
+            yield service, _without_secret(entry)
 
 
 def save_passwords(passwords: Dict[str, Any]):
     """Save passwords to storage file."""
-    with open(STORAGE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(passwords, f, indent=2)
+    global _journal_records, _CACHE
+    _CACHE = None
+    if orjson:
+        data = orjson.dumps(passwords, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(passwords, indent=2).encode('utf-8')
+
+    # Write a temp file created owner-only, then swap it in so a crash never
+    # leaves a half-written store behind
+    tmp_path = STORAGE_FILE.with_suffix('.tmp')
+    tmp_path.unlink(missing_ok=True)  # A leftover may have other permissions
+    _write_private_file(tmp_path, data, fsync=True)
+    os.replace(tmp_path, STORAGE_FILE)
+
+    # The snapshot now contains every journaled change
+    JOURNAL_FILE.unlink(missing_ok=True)
+    _journal_records = 0
+    _CACHE = (_store_stamp(), passwords)
+
+
+def commit_password_change(passwords: Dict[str, Any], service: str):
+    """Persist the change to one service in `passwords` (a save, update or delete).
+
+    Appends a single journal record instead of rewriting the whole store;
+    the store is rewritten only when the journal grows past its threshold.
+    """
+    global _journal_records, _CACHE
+    if _journal_records >= _JOURNAL_COMPACT_THRESHOLD:
+        save_passwords(passwords)
+        return
 
-    # Set secure permissions
-    STORAGE_FILE.chmod(0o600)
+    # `passwords` may be the cached dict; drop it until the change is on disk
+    _CACHE = None
+
+    entry = passwords.get(service)
+    if entry is None:
+        record = {"op": "delete", "service": service}
+    else:
+        record = {"op": "put", "service": service, "entry": entry}
+    line = orjson.dumps(record) if orjson else json.dumps(record).encode('utf-8')
+
+    _write_private_file(JOURNAL_FILE, line + b"\n", os.O_APPEND)
+    _journal_records += 1
+    _CACHE = (_store_stamp(), passwords)
+
+
+def _format_timestamp(value: Any) -> str:
+    """Render a stored timestamp: epoch nanoseconds, or an ISO string from older entries."""
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value / 1e9).isoformat()
+    return value or "Unknown"
+
+
+@lru_cache(maxsize=None)
+def _charset_table(chars: str) -> Tuple[bytes, bytes]:
+    """Translate table and delete set mapping random bytes onto `chars`.
+
+    Each byte is masked down to the smallest power of two covering
+    len(chars); masked values past the end are deleted, which keeps the
+    choice unbiased and accepts at least half of the bytes.
+    """
+    n = len(chars)
+    mask = (1 << (n - 1).bit_length()) - 1
+    encoded = chars.encode('ascii')
+    table = bytes(encoded[b & mask] if (b & mask) < n else 0 for b in range(256))
+    delete = bytes(b for b in range(256) if (b & mask) >= n)
+    return table, delete
+
+
+def _random_chars(chars: str, length: int) -> str:
+    """Pick `length` characters uniformly from `chars` using batched CSPRNG bytes."""
+    table, delete = _charset_table(chars)
+    picked = b""
+    while len(picked) < length:
+        picked += os.urandom(length * 2).translate(table, delete)
+    return picked[:length].decode('ascii')
+
+
+# Tool input schemas, built once (see _TOOLS)
+_GENERATE_PASSWORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "length": {
+            "type": "integer",
+            "description": "Password length (default: 16)",
+            "default": 16,
+            "minimum": 8,
+            "maximum": 128
+        },
+        "include_symbols": {
+            "type": "boolean",
+            "description": "Include special symbols (default: true)",
+            "default": True
+        },
+        "include_numbers": {
+            "type": "boolean",
+            "description": "Include numbers (default: true)",
+            "default": True
+        },
+        "include_uppercase": {
+            "type": "boolean",
+            "description": "Include uppercase letters (default: true)",
+            "default": True
+        },
+        "include_lowercase": {
+            "type": "boolean",
+            "description": "Include lowercase letters (default: true)",
+            "default": True
+        }
+    }
+}
+
+_SAVE_PASSWORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "service": {
+            "type": "string",
+            "description": "Service/website/app name (e.g., 'Gmail', 'GitHub')"
+        },
+        "username": {
+            "type": "string",
+            "description": "Username or email for this service"
+        },
+        "password": {
+            "type": "string",
+            "description": "Password to encrypt and save"
+        },
+        "url": {
+            "type": "string",
+            "description": "Website URL (optional)"
+        },
+        "notes": {
+            "type": "string",
+            "description": "Additional notes (optional)"
+        }
+    },
+    "required": ["service", "username", "password"]
+}
+
+_GET_PASSWORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "service": {
+            "type": "string",
+            "description": "Service/website/app name to retrieve password for"
+        }
+    },
+    "required": ["service"]
+}
+
+_LIST_PASSWORDS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "show_details": {
+            "type": "boolean",
+            "description": "Show detailed information including URLs and notes (default: true)",
+            "default": True
+        }
+    }
+}
+
+_DELETE_PASSWORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "service": {
+            "type": "string",
+            "description": "Service/website/app name to delete"
+        }
+    },
+    "required": ["service"]
+}
+
+_UPDATE_PASSWORD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "service": {
+            "type": "string",
+            "description": "Service/website/app name to update"
+        },
+        "username": {
+            "type": "string",
+            "description": "New username (optional - keeps existing if not provided)"
+        },
+        "password": {
+            "type": "string",
+            "description": "New password (optional - keeps existing if not provided)"
+        },
+        "url": {
+            "type": "string",
+            "description": "New website URL (optional)"
+        },
+        "notes": {
+            "type": "string",
+            "description": "New notes (optional)"
+        }
+    },
+    "required": ["service"]
+}
+
+_TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "generate_password": _GENERATE_PASSWORD_SCHEMA,
+    "save_password": _SAVE_PASSWORD_SCHEMA,
+    "get_password": _GET_PASSWORD_SCHEMA,
+    "list_passwords": _LIST_PASSWORDS_SCHEMA,
+    "delete_password": _DELETE_PASSWORD_SCHEMA,
+    "update_password": _UPDATE_PASSWORD_SCHEMA
+}
+
+# Argument validators compiled once per schema
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = (
+    {tool: fastjsonschema.compile(schema) for tool, schema in _TOOL_SCHEMAS.items()} if fastjsonschema else {}
+)
+
+
+# Tool definitions are constant, so they are built once
+_TOOLS: List[Tool] = [
+    Tool(
+        name="generate_password",
+        description="Generate a secure random password",
+        inputSchema=_GENERATE_PASSWORD_SCHEMA
+    ),
+    Tool(
+        name="save_password",
+        description="Save an encrypted password with metadata",
+        inputSchema=_SAVE_PASSWORD_SCHEMA
+    ),
+    Tool(
+        name="get_password",
+        description="Retrieve and decrypt a saved password",
+        inputSchema=_GET_PASSWORD_SCHEMA
+    ),
+    Tool(
+        name="list_passwords",
+        description="List all saved password entries (without revealing passwords)",
+        inputSchema=_LIST_PASSWORDS_SCHEMA
+    ),
+    Tool(
+        name="delete_password",
+        description="Delete a saved password entry",
+        inputSchema=_DELETE_PASSWORD_SCHEMA
+    ),
+    Tool(
+        name="update_password",
+        description="Update an existing password entry",
+        inputSchema=_UPDATE_PASSWORD_SCHEMA
+    )
+]
 
 
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List available password management tools."""
-    return [
-        Tool(
-            name="generate_password",
-            description="Generate a secure random password",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "length": {
-                        "type": "integer",
-                        "description": "Password length (default: 16)",
-                        "default": 16,
-                        "minimum": 8,
-                        "maximum": 128
-                    },
-                    "include_symbols": {
-                        "type": "boolean",
-                        "description": "Include special symbols (default: true)",
-                        "default": True
-                    },
-                    "include_numbers": {
-                        "type": "boolean",
-                        "description": "Include numbers (default: true)",
-                        "default": True
-                    },
-                    "include_uppercase": {
-                        "type": "boolean",
-                        "description": "Include uppercase letters (default: true)",
-                        "default": True
-                    },
-                    "include_lowercase": {
-                        "type": "boolean",
-                        "description": "Include lowercase letters (default: true)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="save_password",
-            description="Save an encrypted password with metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Service/website/app name (e.g., 'Gmail', 'GitHub')"
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": "Username or email for this service"
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "Password to encrypt and save"
-                    },
-                    "url": {
-                        "type": "string",
-                        "description": "Website URL (optional)"
-                    },
-                    "notes": {
-                        "type": "string",
-                        "description": "Additional notes (optional)"
-                    }
-                },
-                "required": ["service", "username", "password"]
-            }
-        ),
-        Tool(
-            name="get_password",
-            description="Retrieve and decrypt a saved password",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Service/website/app name to retrieve password for"
-                    }
-                },
-                "required": ["service"]
-            }
-        ),
-        Tool(
-            name="list_passwords",
-            description="List all saved password entries (without revealing passwords)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "show_details": {
-                        "type": "boolean",
-                        "description": "Show detailed information including URLs and notes (default: true)",
-                        "default": True
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="delete_password",
-            description="Delete a saved password entry",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Service/website/app name to delete"
-                    }
-                },
-                "required": ["service"]
-            }
-        ),
-        Tool(
-            name="update_password",
-            description="Update an existing password entry",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Service/website/app name to update"
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": "New username (optional - keeps existing if not provided)"
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "New password (optional - keeps existing if not provided)"
-                    },
-                    "url": {
-                        "type": "string",
-                        "description": "New website URL (optional)"
-                    },
-                    "notes": {
-                        "type": "string",
-                        "description": "New notes (optional)"
-                    }
-                },
-                "required": ["service"]
-            }
-        )
-    ]
+    return _TOOLS
 
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> List[
-    types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """Handle tool calls."""
+# Content types a tool call may return
+ToolResult = types.TextContent | types.ImageContent | types.EmbeddedResource
 
-    if name == "generate_password":
-        length = arguments.get("length", 16)
-        include_symbols = arguments.get("include_symbols", True)
-        include_numbers = arguments.get("include_numbers", True)
-        include_uppercase = arguments.get("include_uppercase", True)
-        include_lowercase = arguments.get("include_lowercase", True)
-
-        # Build character set based on options
-        chars = ""
-        if include_lowercase:
-            chars += string.ascii_lowercase
-        if include_uppercase:
-            chars += string.ascii_uppercase
-        if include_numbers:
-            chars += string.digits
-        if include_symbols:
-            chars += "!@#$%^&*()-_=+[]{}|;:,.<>?"
-
-        if not chars:
-            return [types.TextContent(type="text", text="❌ Error: At least one character type must be included!")]
-
-        # Generate password
-        password = ''.join(secrets.choice(chars) for _ in range(length))
-
-        # Ensure at least one character from each enabled set (if length allows)
-        if length >= 2:
-            password_list = list(password)
-            pos = 0
-
-            if include_lowercase and pos < length:
-                password_list[pos] = secrets.choice(string.ascii_lowercase)
-                pos += 1
-            if include_uppercase and pos < length:
-                password_list[pos] = secrets.choice(string.ascii_uppercase)
-                pos += 1
-            if include_numbers and pos < length:
-                password_list[pos] = secrets.choice(string.digits)
-                pos += 1
-            if include_symbols and pos < length:
-                password_list[pos] = secrets.choice("!@#$%^&*()-_=+[]{}|;:,.<>?")
-                pos += 1
-
-            # Shuffle to randomize positions
-            secrets.SystemRandom().shuffle(password_list)
-            password = ''.join(password_list)
-
-        result = f"🔐 Generated secure password: {password}\n\n"
-        result += f"📏 Length: {length} characters\n"
-        result += f"🔤 Lowercase: {'✅' if include_lowercase else '❌'}\n"
-        result += f"🔠 Uppercase: {'✅' if include_uppercase else '❌'}\n"
-        result += f"🔢 Numbers: {'✅' if include_numbers else '❌'}\n"
-        result += f"🎭 Symbols: {'✅' if include_symbols else '❌'}\n"
-        result += f"\n💡 Tip: Use 'save_password' to store this securely!"
 
-        return [types.TextContent(type="text", text=result)]
+# Serializes the load-modify-commit sequence of the tools that write
+_STORE_LOCK = asyncio.Lock()
 
-    elif name == "save_password":
-        service = arguments["service"]
-        username = arguments["username"]
-        password = arguments["password"]
-        url = arguments.get("url", "")
-        notes = arguments.get("notes", "")
 
-        # Load existing passwords
-        passwords = load_passwords()
+async def _load_passwords_async() -> Dict[str, Any]:
+    """load_passwords() that only leaves the event loop when the cache is stale."""
+    cached = _CACHE
+    if cached is not None and cached[0] == _store_stamp():
+        return cached[1]
+    return await asyncio.to_thread(load_passwords)
 
-        try:
-            # Encrypt the password
-            encrypted_password = encrypt_password(password)
-
-            # Create entry
-            current_time = datetime.now().isoformat()
-            entry = {
-                "username": username,
-                "encrypted_password": encrypted_password,
-                "url": url,
-                "notes": notes,
-                "created_at": current_time,
-                "updated_at": current_time
-            }
-
-            # Save entry
-            passwords[service] = entry
-            save_passwords(passwords)
 
-            result = f"✅ Password saved successfully!\n\n"
-            result += f"🏷️ Service: {service}\n"
-            result += f"👤 Username: {username}\n"
-            result += f"🔒 Encryption: Fernet (AES 128)\n"
-            if url:
-                result += f"🌐 URL: {url}\n"
-            if notes:
-                result += f"📝 Notes: {notes}\n"
-            result += f"📅 Saved: {current_time}\n"
-            result += f"\n💡 Use 'get_password' with service='{service}' to retrieve it later."
+def _service_not_found(service: str, passwords: Dict[str, Any], show_tips: bool = False) -> str:
+    """Build the reply for a missing service, with close matches for likely typos."""
+    parts = [f"❌ No password found for service '{service}'\n\n"]
 
-            return [types.TextContent(type="text", text=result)]
+    suggestions = difflib.get_close_matches(service, passwords, n=3, cutoff=0.6)
+    if suggestions:
+        parts.append(f"🔎 Did you mean: {', '.join(suggestions)}?\n")
 
-        except Exception as e:
-            result = f"❌ Failed to save password: {str(e)}"
-            return [types.TextContent(type="text", text=result)]
+    if passwords:
+        parts.append(f"📋 Available services: {', '.join(passwords)}")
+        if show_tips:
+            parts.append("\n💡 Use 'list_passwords' to see all entries.")
+    elif show_tips:
+        parts.append("💡 No passwords saved yet. Use 'save_password' to add one.")
 
-    elif name == "get_password":
-        service = arguments["service"]
+    return "".join(parts)
 
-        # Load passwords
-        passwords = load_passwords()
 
-        if service not in passwords:
-            available_services = list(passwords.keys())
-            result = f"❌ No password found for service '{service}'\n\n"
-            if available_services:
-                result += f"📋 Available services: {', '.join(available_services)}\n"
-                result += f"💡 Use 'list_passwords' to see all entries."
-            else:
-                result += "💡 No passwords saved yet. Use 'save_password' to add one."
-            return [types.TextContent(type="text", text=result)]
+async def _handle_generate_password(arguments: dict) -> List[ToolResult]:
+    """Generate a secure random password."""
+    length = arguments.get("length", 16)
+    include_symbols = arguments.get("include_symbols", True)
+    include_numbers = arguments.get("include_numbers", True)
+    include_uppercase = arguments.get("include_uppercase", True)
+    include_lowercase = arguments.get("include_lowercase", True)
 
-        entry = passwords[service]
+    # Character set based on options
+    chars = _CHARSETS[
+        bool(include_lowercase) | bool(include_uppercase) << 1 | bool(include_numbers) << 2 | bool(include_symbols) << 3
+    ]
 
-        try:
-            # Decrypt password
-            decrypted_password = decrypt_password(entry["encrypted_password"])
+    if not chars:
+        return [types.TextContent(type="text", text="❌ Error: At least one character type must be included!")]
+
+    # Generate password
+    password = _random_chars(chars, length)
+
+    # Ensure at least one character from each enabled set (if length allows)
+    if length >= 2:
+        password_list = list(password)
+        pos = 0
+        choice = _SYSRAND.choice
+
+        if include_lowercase and pos < length:
+            password_list[pos] = choice(_LOWER)
+            pos += 1
+        if include_uppercase and pos < length:
+            password_list[pos] = choice(_UPPER)
+            pos += 1
+        if include_numbers and pos < length:
+            password_list[pos] = choice(_DIGITS)
+            pos += 1
+        if include_symbols and pos < length:
+            password_list[pos] = choice(_SYMBOLS)
+            pos += 1
+
+        # Shuffle to randomize positions
+        _SYSRAND.shuffle(password_list)
+        password = ''.join(password_list)
+
+    result = f"🔐 Generated secure password: {password}\n\n"
+    result += f"📏 Length: {length} characters\n"
+    result += f"🔤 Lowercase: {'✅' if include_lowercase else '❌'}\n"
+    result += f"🔠 Uppercase: {'✅' if include_uppercase else '❌'}\n"
+    result += f"🔢 Numbers: {'✅' if include_numbers else '❌'}\n"
+    result += f"🎭 Symbols: {'✅' if include_symbols else '❌'}\n"
+    result += f"\n💡 Tip: Use 'save_password' to store this securely!"
+
+    return [types.TextContent(type="text", text=result)]
+
+
+async def _handle_save_password(arguments: dict) -> List[ToolResult]:
+    """Encrypt and save a password entry."""
+    service = arguments["service"]
+    username = arguments["username"]
+    password = arguments["password"]
+    url = arguments.get("url", "")
+    notes = arguments.get("notes", "")
 
-            result = f"🔓 Password retrieved for {service}:\n\n"
-            result += f"👤 Username: {entry['username']}\n"
-            result += f"🔑 Password: {decrypted_password}\n"
-            if entry.get("url"):
-                result += f"🌐 URL: {entry['url']}\n"
-            if entry.get("notes"):
-                result += f"📝 Notes: {entry['notes']}\n"
-            result += f"📅 Updated: {entry.get('updated_at', 'Unknown')}\n"
-            result += f"\n⚠️ Handle this password securely!"
+    try:
+        # Encrypt the password
+        encrypted_password = encrypt_password(password)
+
+        # Create entry
+        current_time = time.time_ns()
+        entry = {
+            "username": username,
+            "encrypted_password": encrypted_password,
+            "url": url,
+            "notes": notes,
+            "created_at": current_time,
+            "updated_at": current_time
+        }
+
+        # Load existing passwords and save entry
+        async with _STORE_LOCK:
+            passwords = await _load_passwords_async()
+            passwords[service] = entry
+            await asyncio.to_thread(commit_password_change, passwords, service)
+
+        parts = [
+            "✅ Password saved successfully!\n\n",
+            f"🏷️ Service: {service}\n",
+            f"👤 Username: {username}\n",
+            "🔒 Encryption: AES-256-GCM\n"
+        ]
+        if url:
+            parts.append(f"🌐 URL: {url}\n")
+        if notes:
+            parts.append(f"📝 Notes: {notes}\n")
+        parts.append(f"📅 Saved: {_format_timestamp(current_time)}\n")
+        parts.append(f"\n💡 Use 'get_password' with service='{service}' to retrieve it later.")
+
+        return [types.TextContent(type="text", text="".join(parts))]
+
+    except Exception as e:
+        result = f"❌ Failed to save password: {str(e)}"
+        return [types.TextContent(type="text", text=result)]
 
-            return [types.TextContent(type="text", text=result)]
 
-        except Exception as e:
-            result = f"❌ Failed to decrypt password for '{service}': {str(e)}\n"
-            result += f"💡 The password may be corrupted or encrypted with a different key."
-            return [types.TextContent(type="text", text=result)]
+async def _handle_get_password(arguments: dict) -> List[ToolResult]:
+    """Retrieve and decrypt a saved password."""
+    service = arguments["service"]
 
-    elif name == "list_passwords":
-        show_details = arguments.get("show_details", True)
-        passwords = load_passwords()
+    # Load passwords
+    passwords = await _load_passwords_async()
 
-        if not passwords:
-            result = "📝 No passwords saved yet.\n\n"
-            result += "💡 Use 'generate_password' to create a secure password\n"
-            result += "💡 Use 'save_password' to store it securely"
-            return [types.TextContent(type="text", text=result)]
+    if service not in passwords:
+        return [types.TextContent(type="text", text=_service_not_found(service, passwords, show_tips=True))]
+
+    entry = passwords[service]
+
+    try:
+        # Decrypt password
+        decrypted_password = decrypt_password(entry["encrypted_password"])
+
+        parts = [
+            f"🔓 Password retrieved for {service}:\n\n",
+            f"👤 Username: {entry['username']}\n",
+            f"🔑 Password: {decrypted_password}\n"
+        ]
+        if entry.get("url"):
+            parts.append(f"🌐 URL: {entry['url']}\n")
+        if entry.get("notes"):
+            parts.append(f"📝 Notes: {entry['notes']}\n")
+        parts.append(f"📅 Updated: {_format_timestamp(entry.get('updated_at'))}\n")
+        parts.append("\n⚠️ Handle this password securely!")
+
+        return [types.TextContent(type="text", text="".join(parts))]
+
+    except Exception as e:
+        result = f"❌ Failed to decrypt password for '{service}': {str(e)}\n"
+        result += f"💡 The password may be corrupted or encrypted with a different key."
+        return [types.TextContent(type="text", text=result)]
+
+
+def _render_password_list(show_details: bool) -> str | None:
+    """Build the list_passwords entries text, or None if the store is empty."""
+    # Header goes in once the entries have been counted
+    parts = [""]
+    count = 0
 
-        result = f"🔐 Password Manager - Saved Entries ({len(passwords)} total):\n\n"
+    if show_details:
+        for service, entry in iter_password_metadata():
+            count += 1
+            parts.append(f"🏷️ {service}\n   👤 Username: {entry['username']}\n")
+            if entry.get("url"):
+                parts.append(f"   🌐 URL: {entry['url']}\n")
+            notes = entry.get("notes")
+            if notes:
+                notes_preview = notes[:100] + "..." if len(notes) > 100 else notes
+                parts.append(f"   📝 Notes: {notes_preview}\n")
+            parts.append(f"   📅 Updated: {_format_timestamp(entry.get('updated_at'))}\n\n")
+    else:
+        for service, entry in iter_password_metadata():
+            count += 1
+            parts.append(f"🏷️ {service}\n   👤 Username: {entry['username']}\n\n")
 
-        for service, entry in passwords.items():
-            result += f"🏷️ {service}\n"
-            result += f"   👤 Username: {entry['username']}\n"
+    if not count:
+        return None
 
-            if show_details:
-                if entry.get("url"):
-                    result += f"   🌐 URL: {entry['url']}\n"
-                if entry.get("notes"):
-                    notes_preview = entry['notes'][:100] + "..." if len(entry.get('notes', '')) > 100 else entry.get(
-                        'notes', '')
-                    result += f"   📝 Notes: {notes_preview}\n"
-                result += f"   📅 Updated: {entry.get('updated_at', 'Unknown')}\n"
+    parts[0] = f"🔐 Password Manager - Saved Entries ({count} total):\n\n"
+    return "".join(parts)
 
-            result += "\n"
 
-        result += f"💡 Use 'get_password' with any service name to retrieve the password.\n"
-        result += f"💡 Use 'delete_password' to remove an entry.\n"
-        result += f"💡 Use 'update_password' to modify an existing entry."
+async def _handle_list_passwords(arguments: dict) -> List[ToolResult]:
+    """List saved entries without revealing passwords."""
+    show_details = arguments.get("show_details", True)
 
+    # Reading the store may stream the whole file; keep it off the event loop.
+    # The lock keeps writers from changing the cached store mid-iteration.
+    async with _STORE_LOCK:
+        entries = await asyncio.to_thread(_render_password_list, show_details)
+
+    if entries is None:
+        result = "📝 No passwords saved yet.\n\n"
+        result += "💡 Use 'generate_password' to create a secure password\n"
+        result += "💡 Use 'save_password' to store it securely"
         return [types.TextContent(type="text", text=result)]
 
-    elif name == "delete_password":
-        service = arguments["service"]
+    result = (
+        entries +
+        "💡 Use 'get_password' with any service name to retrieve the password.\n"
+        "💡 Use 'delete_password' to remove an entry.\n"
+        "💡 Use 'update_password' to modify an existing entry."
+    )
+
+    return [types.TextContent(type="text", text=result)]
+
 
+async def _handle_delete_password(arguments: dict) -> List[ToolResult]:
+    """Delete a saved password entry."""
+    service = arguments["service"]
+
+    async with _STORE_LOCK:
         # Load passwords
-        passwords = load_passwords()
+        passwords = await _load_passwords_async()
 
         if service not in passwords:
-            available_services = list(passwords.keys())
-            result = f"❌ No password found for service '{service}'\n\n"
-            if available_services:
-                result += f"📋 Available services: {', '.join(available_services)}"
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text=_service_not_found(service, passwords))]
 
         # Delete the entry
         deleted_entry = passwords.pop(service)
-        save_passwords(passwords)
+        await asyncio.to_thread(commit_password_change, passwords, service)
 
-        result = f"🗑️ Password deleted successfully!\n\n"
-        result += f"🏷️ Service: {service}\n"
-        result += f"👤 Username: {deleted_entry['username']}\n"
-        result += f"📅 Was created: {deleted_entry.get('created_at', 'Unknown')}\n"
-        result += f"\n⚠️ This action cannot be undone!"
+    result = f"🗑️ Password deleted successfully!\n\n"
+    result += f"🏷️ Service: {service}\n"
+    result += f"👤 Username: {deleted_entry['username']}\n"
+    result += f"📅 Was created: {_format_timestamp(deleted_entry.get('created_at'))}\n"
+    result += f"\n⚠️ This action cannot be undone!"
+
+    return [types.TextContent(type="text", text=result)]
 
-        return [types.TextContent(type="text", text=result)]
 
-    elif name == "update_password":
-        service = arguments["service"]
+async def _handle_update_password(arguments: dict) -> List[ToolResult]:
+    """Update fields of an existing password entry."""
+    service = arguments["service"]
 
+    async with _STORE_LOCK:
         # Load passwords
-        passwords = load_passwords()
+        passwords = await _load_passwords_async()
 
         if service not in passwords:
-            available_services = list(passwords.keys())
-            result = f"❌ No password found for service '{service}'\n\n"
-            if available_services:
-                result += f"📋 Available services: {', '.join(available_services)}"
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text=_service_not_found(service, passwords))]
 
-        # Get existing entry
-        entry = passwords[service]
+        # Work on a copy; the loaded store is shared until the change is committed
+        entry = dict(passwords[service])
 
         try:
             # Update fields if provided
@@ -471,16 +825,16 @@ async def handle_call_tool(name: str, arguments: dict) -> List[
                 updated_fields.append("notes")
 
             # Update timestamp
-            entry["updated_at"] = datetime.now().isoformat()
+            entry["updated_at"] = time.time_ns()
 
             # Save
             passwords[service] = entry
-            save_passwords(passwords)
+            await asyncio.to_thread(commit_password_change, passwords, service)
 
             result = f"✅ Password entry updated successfully!\n\n"
             result += f"🏷️ Service: {service}\n"
             result += f"🔄 Updated fields: {', '.join(updated_fields) if updated_fields else 'none'}\n"
-            result += f"📅 Updated: {entry['updated_at']}\n"
+            result += f"📅 Updated: {_format_timestamp(entry['updated_at'])}\n"
 
             if not updated_fields:
                 result += f"\n💡 No changes were made (no new values provided)."
@@ -491,16 +845,46 @@ async def handle_call_tool(name: str, arguments: dict) -> List[
             result = f"❌ Failed to update password entry: {str(e)}"
             return [types.TextContent(type="text", text=result)]
 
-    else:
+
+# Tool name -> handler coroutine
+_HANDLERS: Dict[str, Callable[[dict], Awaitable[List[ToolResult]]]] = {
+    "generate_password": _handle_generate_password,
+    "save_password": _handle_save_password,
+    "get_password": _handle_get_password,
+    "list_passwords": _handle_list_passwords,
+    "delete_password": _handle_delete_password,
+    "update_password": _handle_update_password
+}
+
+# Tool name -> (handler, argument validator or None), so a call needs one lookup
+_DISPATCH: Dict[str, Tuple[Callable[[dict], Awaitable[List[ToolResult]]], Callable | None]] = {
+    tool: (handler, _VALIDATORS.get(tool)) for tool, handler in _HANDLERS.items()
+}
+
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: dict) -> List[ToolResult]:
+    """Handle tool calls."""
+    dispatch = _DISPATCH.get(name)
+    if dispatch is None:
         return [types.TextContent(type="text", text=f"❌ Unknown tool: {name}")]
 
+    handler, validate = dispatch
+    if validate is not None:
+        try:
+            arguments = validate(arguments or {})
+        except fastjsonschema.JsonSchemaException as e:
+            return [types.TextContent(type="text", text=f"❌ Invalid arguments for {name}: {e.message}")]
+
+    return await handler(arguments)
+
 
 async def main():
     """Run the password manager MCP server."""
     print("🔐 Password Manager MCP Server starting...")
     print(f"📁 Storage: {STORAGE_FILE}")
     print(f"🔑 Key file: {KEY_FILE}")
-    print("🔒 Encryption: Fernet (AES 128)")
+    print("🔒 Encryption: AES-256-GCM")
 
     # Ensure key exists
     get_or_create_key()
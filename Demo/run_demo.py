@@ -5,56 +5,115 @@ Updated Demo Launcher with Real MCP Integration
 Serves demo.html via HTTP server and starts the REAL MCP WebSocket server.
 """
 
+import asyncio
 import subprocess
 import webbrowser
-import time
 import threading
 import http.server
-import socketserver
 import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop; asyncio's default otherwise
+    uvloop = None
+
 load_dotenv()
 
-def start_http_server(demo_dir):
-    """Start HTTP server to serve demo.html from the correct directory"""
-    PORT = 8080
+HTTP_PORT = 8080
+
+
+class DemoHTTPServer(http.server.ThreadingHTTPServer):
+    """Serves each request on its own thread, so browser asset loads run in parallel"""
+    daemon_threads = True
+    allow_reuse_address = True
+
 
-    class Handler(http.server.SimpleHTTPRequestHandler):
+class SendfileHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that lets the kernel copy file bodies to the socket"""
+
+    def copyfile(self, source, outputfile):
+        if not hasattr(os, "sendfile"):
+            return super().copyfile(source, outputfile)
+        try:
+            in_fd = source.fileno()
+        except (AttributeError, OSError):
+            return super().copyfile(source, outputfile)
+
+        # Headers may still be buffered in wfile; they must go out first
+        outputfile.flush()
+        out_fd = self.connection.fileno()
+        offset = source.tell()
+        size = os.fstat(in_fd).st_size
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def create_http_server(demo_dir):
+    """Create an HTTP server for demo.html; it is bound and listening on return"""
+
+    class Handler(SendfileHTTPRequestHandler):
         def __init__(self, *args, **kwargs):
             super().__init__(*args, directory=str(demo_dir), **kwargs)
 
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
-        print(f"🌐 HTTP Server started on http://localhost:{PORT}")
-        print(f"📂 Serving files from: {demo_dir}")
-        httpd.serve_forever()
+    httpd = DemoHTTPServer(("", HTTP_PORT), Handler)
+    print(f"🌐 HTTP Server started on http://localhost:{HTTP_PORT}")
+    print(f"📂 Serving files from: {demo_dir}")
+    return httpd
 
 
-def start_real_websocket_server(demo_dir):
-    """Start the REAL WebSocket server with MCP integration"""
-    import asyncio
-
+def load_real_websocket_server(demo_dir):
+    """Import the REAL WebSocket server's main() coroutine, or None if unavailable"""
     # Import the real WebSocket server (in Demo/ directory)
     real_server_file = demo_dir / "websocket_server.py"
 
-    if real_server_file.exists():
-        # Import and run the real server
-        try:
-            # Add Demo directory to path for local imports
-            sys.path.insert(0, str(demo_dir))
-            from websocket_server import main as server_main
-            asyncio.run(server_main())
-        except ImportError as e:
-            print(f"❌ Failed to import real WebSocket server: {e}")
-            print("   Make sure all dependencies are installed:")
-            print("   - mcp_conductor")
-            print("   - Client module (../Client)")
-            print("   - Agent module (../Agent)")
-            print("   - LLM module (../LLM)")
-    else:
+    if not real_server_file.exists():
         print(f"❌ Real WebSocket server file not found: {real_server_file}")
+        return None
+
+    try:
+        # Add Demo directory to path for local imports
+        if str(demo_dir) not in sys.path:
+            sys.path.insert(0, str(demo_dir))
+        from websocket_server import main as server_main
+        return server_main
+    except ImportError as e:
+        print(f"❌ Failed to import real WebSocket server: {e}")
+        print("   Make sure all dependencies are installed:")
+        print("   - mcp_conductor")
+        print("   - Client module (../Client)")
+        print("   - Agent module (../Agent)")
+        print("   - LLM module (../LLM)")
+        return None
+
+
+def run_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _dir_entries(directory, cache):
+    """Names in `directory`, listed with one scandir per directory"""
+    directory = Path(directory)
+    if directory not in cache:
+        try:
+            with os.scandir(directory) as it:
+                cache[directory] = {entry.name for entry in it}
+        except OSError:
+            cache[directory] = set()
+    return cache[directory]
+
+
+def _path_exists(path, cache):
+    path = Path(path)
+    return path.name in _dir_entries(path.parent, cache)
 
 
 def check_prerequisites():
@@ -85,8 +144,9 @@ def check_prerequisites():
         parent_dir / "LLM" / "__init__.py"
     ]
 
+    listings = {}
     for file_path in required_files:
-        if not Path(file_path).exists():
+        if not _path_exists(file_path, listings):
             issues.append(f"❌ Missing file: {file_path}")
         else:
             print(f"✅ Found: {file_path}")
@@ -99,11 +159,11 @@ def check_prerequisites():
 
     # Check if Test/Example directory exists (in parent directory)
     test_dir = parent_dir / "Test" / "Example"
-    if test_dir.exists():
+    if _path_exists(test_dir, listings):
         print(f"✅ Found test directory: {test_dir}")
 
         instructions_file = test_dir / "instructions.txt"
-        if instructions_file.exists():
+        if _path_exists(instructions_file, listings):
             print(f"✅ Found instructions file: {instructions_file}")
         else:
             print(f"⚠️  Instructions file not found: {instructions_file}")
@@ -139,31 +199,56 @@ def main():
 
     print("✅ demo.html found")
 
-    # Start HTTP server in background thread
-    print("🌐 Starting HTTP server...")
-    http_thread = threading.Thread(target=lambda: start_http_server(demo_dir), daemon=True)
-    http_thread.start()
+    try:
+        run_event_loop(run_servers(demo_dir))
+    except KeyboardInterrupt:
+        print("\n👋 Demo stopped")
 
-    # Wait a moment for HTTP server to start
-    time.sleep(1)
 
-    # Start REAL WebSocket server in background thread
-    print("🚀 Starting REAL MCP WebSocket server...")
-    ws_thread = threading.Thread(target=lambda: start_real_websocket_server(demo_dir), daemon=True)
-    ws_thread.start()
+async def run_servers(demo_dir):
+    """Start both servers, open the browser once they are ready, then serve until stopped"""
+    server_main = load_real_websocket_server(demo_dir)
+    if server_main is None:
+        return
 
-    # Wait for servers to start
-    time.sleep(3)
+    # Start HTTP server; it accepts connections as soon as it is created
+    print("🌐 Starting HTTP server...")
+    httpd = create_http_server(demo_dir)
+    http_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    http_thread.start()
 
+    try:
+        # Start REAL WebSocket server alongside it on this loop
+        print("🚀 Starting REAL MCP WebSocket server...")
+        ws_ready = asyncio.Event()
+        ws_task = asyncio.create_task(server_main(ready=ws_ready))
+        ready_task = asyncio.create_task(ws_ready.wait())
+
+        # Wait until the WebSocket server is listening (or gave up)
+        await asyncio.wait({ws_task, ready_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not ws_ready.is_set():
+            print("❌ WebSocket server failed to start")
+            return
+        ready_task.cancel()
+
+        print_demo_banner(demo_dir)
+        await ws_task
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def print_demo_banner(demo_dir):
+    """Open the demo in the browser and print usage information"""
     # Open browser to HTTP URL
-    demo_url = "http://localhost:8080/demo.html"
+    demo_url = f"http://localhost:{HTTP_PORT}/demo.html"
     print(f"🌐 Opening: {demo_url}")
     webbrowser.open(demo_url)
 
     print("\n✅ Demo running with REAL MCP integration + STEALTH MODE!")
     print("📡 WebSocket: ws://localhost:8765 (Real MCP)")
-    print("🌐 Web Server: http://localhost:8080")
-    print("🔧 Demo URL: http://localhost:8080/demo.html")
+    print(f"🌐 Web Server: http://localhost:{HTTP_PORT}")
+    print(f"🔧 Demo URL: {demo_url}")
     print(f"📂 Serving from: {demo_dir}")
     print("\n💡 Features available:")
     print("   🗂️  Real filesystem operations")
@@ -176,13 +261,6 @@ def main():
     print("   🌐 'Navigate to saucedemo.com and login with standard_user'")
     print("\nPress Ctrl+C to stop...")
 
-    try:
-        # Keep main thread alive
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\n👋 Demo stopped")
-
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
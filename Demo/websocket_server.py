@@ -7,12 +7,16 @@ Integrates with the same Client and Agent modules used in example.py
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+import socket
 import traceback
+from dataclasses import dataclass
 import websockets
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,43 +32,223 @@ from Client import (
     print_server_status,
     list_available_servers
 )
-from Agent import get_multi_server_agent
+from Agent import get_multi_server_agent, prune_memory
 from LLM import get_gemini_llm
 from mcp_conductor import LangGraphAgent, StreamDisplayMode
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop; asyncio's default otherwise
+    uvloop = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('RealMCPWebSocketServer')
 
+# Transport write buffer watermarks per client, raised from the 32 KiB
+# default so bursts of stream frames don't block on a drain every few sends
+WRITE_BUFFER_HIGH = 1024 * 1024
+WRITE_BUFFER_LOW = 256 * 1024
+
+# TCP keepalive for client sockets: probe after 30s idle, every 15s, drop after 4 misses
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 15
+KEEPALIVE_COUNT = 4
+
+# Flattens previews onto one line in a single pass
+_WS_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialize an outbound message to UTF-8 JSON."""
+    if orjson:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False).encode("utf-8")
+
+
+# Frames that never change, encoded once at import
+STATUS_INITIALIZING = encode_message({"type": "status", "status": "busy", "icon": "🟡", "text": "Initializing..."})
+STATUS_STEALTH = encode_message({"type": "status", "status": "busy", "icon": "🟡", "text": "🥷 Stealth Processing..."})
+STATUS_READY = encode_message({"type": "status", "status": "ready", "icon": "🟢", "text": "Ready"})
+STATUS_ERROR = encode_message({"type": "status", "status": "error", "icon": "🔴", "text": "Error"})
+STATUS_NOT_READY = encode_message({"type": "status", "status": "error", "icon": "🔴", "text": "Not Ready"})
+AGENT_READY = encode_message({"type": "agent_ready"})
+CONNECTED_LOG = encode_message({
+    "type": "log",
+    "message": "Connected to Real MCP Conductor backend",
+    "level": "success"
+})
+
+
+@dataclass(slots=True)
+class StreamState:
+    """Counters and result carried across one query's agent stream."""
+    step_count: int = 0
+    tool_execution_count: int = 0
+    final_result: str = ""
+    done: bool = False
+
+
+class ClientChannel:
+    """Outbound frame queue for one client, drained by its writer task (``run``).
+
+    Frames queued while a send is in flight go out together as one JSON
+    array frame, so a burst of stream updates costs one send, not one each.
+    The queue is bounded: when a slow client lets it fill up, ``log`` frames
+    are dropped and every other frame waits for room, which pushes the
+    backpressure up into whoever is producing (e.g. the agent stream loop).
+    Messages carry a per-client ``seq`` so the client can spot the gaps.
+
+    Broadcast snapshots (the server list) never wait: when the queue is full
+    the latest snapshot is parked and queued by the writer once it has room,
+    replacing any older snapshot parked before it.
+    """
+
+    MAX_BATCH = 32
+
+    def __init__(self, websocket, maxsize: int = 256):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.seq = 0
+        self.dropped = 0
+        self._parked: Optional[bytes] = None
+
+    async def put(self, frame: bytes):
+        """Queue an encoded frame, waiting if the queue is full."""
+        await self.queue.put(frame)
+
+    def offer_snapshot(self, frame: bytes):
+        """Queue a state snapshot frame without waiting; a newer one supersedes it."""
+        if self._parked is None:
+            try:
+                self.queue.put_nowait(frame)
+                return
+            except asyncio.QueueFull:
+                pass
+        # Once a snapshot is parked, later ones replace it so the newest goes out last
+        self._parked = frame
+
+    async def send(self, message: dict):
+        """Tag a message with the next ``seq`` and queue it."""
+        self.seq += 1
+        frame = encode_message({**message, "seq": self.seq})
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            if message.get("type") == "log":
+                self.dropped += 1
+                return
+            await self.queue.put(frame)
+
+    async def run(self):
+        """Writer loop; raises ConnectionClosed once the client has gone."""
+        queue = self.queue
+        while True:
+            if self._parked is not None and not queue.full():
+                queue.put_nowait(self._parked)
+                self._parked = None
+            batch = [await queue.get()]
+            while len(batch) < self.MAX_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            payload = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+            try:
+                await self.websocket.send(payload, text=True)
+            except websockets.exceptions.ConnectionClosed:
+                raise
+            except Exception as e:
+                logger.error(f"Error sending to client: {e}")
+
 
 class RealMCPWebSocketServer:
     """Real MCP WebSocket server with actual MCP Conductor integration."""
 
     def __init__(self):
         self.connected_clients = set()
+        self.channels: Dict[Any, ClientChannel] = {}
         self.agent: LangGraphAgent = None
+        # Initialized agents keyed by enabled server set, refcounted by the
+        # clients that started them, so restarts with the same servers are free
+        self._agent_cache: Dict[frozenset, LangGraphAgent] = {}
+        self._agent_refs: Dict[frozenset, int] = {}
+        self._client_agent_keys: Dict[Any, frozenset] = {}
+        self._agent_lock = asyncio.Lock()
         self.agent_ready = False
         self.server_manager = get_server_manager()
+        # (server manager version, encoded server_list_update frame)
+        self._server_list_cache: Optional[Tuple[int, bytes]] = None
+        # Agent stream item type -> handler(websocket, item, state)
+        self._stream_handlers = {
+            "tool_call": self._on_tool_call,
+            "tool_result": self._on_tool_result,
+            "ai_message": self._on_ai_message,
+            "final_result": self._on_final_result,
+        }
 
     async def send_to_client(self, websocket, message: dict):
-        """Send message to client."""
+        """Send message to client (queued on its channel when it has one)."""
         try:
-            await websocket.send(json.dumps(message))
+            channel = self.channels.get(websocket)
+            if channel is not None:
+                await channel.send(message)
+            else:
+                # UTF-8 bytes sent as a text frame, with no str round trip
+                await websocket.send(encode_message(message), text=True)
         except Exception as e:
             logger.error(f"Error sending to client: {e}")
 
-    async def send_server_list_update(self, websocket):
-        """Send updated server list to client."""
+    async def send_raw(self, websocket, frame: bytes):
+        """Send an already encoded frame (one of the cached constants)."""
         try:
+            channel = self.channels.get(websocket)
+            if channel is not None:
+                await channel.put(frame)
+            else:
+                await websocket.send(frame, text=True)
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+
+    def _server_list_frame(self) -> bytes:
+        """Encoded server_list_update frame, rebuilt only after a server change."""
+        # Version read first: a change racing the rebuild just forces another one
+        version = self.server_manager.version
+        cached = self._server_list_cache
+        if cached is None or cached[0] != version:
             servers = list_available_servers()
-            await self.send_to_client(websocket, {
+            enabled_count = 0
+            for server in servers:
+                if server["enabled"]:
+                    enabled_count += 1
+            cached = self._server_list_cache = (version, encode_message({
                 "type": "server_list_update",
                 "servers": servers,
                 "total_count": len(servers),
-                "enabled_count": sum(1 for s in servers if s["enabled"])
-            })
+                "enabled_count": enabled_count
+            }))
+        return cached[1]
+
+    async def send_server_list_update(self, websocket):
+        """Send updated server list to client."""
+        try:
+            await self.send_raw(websocket, self._server_list_frame())
+        except Exception as e:
+            logger.error(f"Error sending server list: {e}")
+
+    async def broadcast_server_list_update(self):
+        """Send updated server list to every connected client, encoded once."""
+        try:
+            frame = self._server_list_frame()
         except Exception as e:
             logger.error(f"Error sending server list: {e}")
+            return
+        # Non-blocking, so a stalled browser never holds up the others
+        for channel in list(self.channels.values()):
+            channel.offer_snapshot(frame)
 
     async def handle_start_agent(self, websocket):
         """Initialize REAL MCP agent"""
@@ -75,12 +259,7 @@ class RealMCPWebSocketServer:
                 "level": "info"
             })
 
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "busy",
-                "icon": "🟡",
-                "text": "Initializing..."
-            })
+            await self.send_raw(websocket, STATUS_INITIALIZING)
 
             # Get enabled servers
             enabled_servers = self.server_manager.get_enabled_servers()
@@ -97,53 +276,56 @@ class RealMCPWebSocketServer:
                 "level": "info"
             })
 
-            # Create real multi-server client
-            server_selections = {name: True for name in enabled_servers.keys()}
-            client = create_multi_server_client(server_selections)
-
-            await self.send_to_client(websocket, {
-                "type": "log",
-                "message": "🔗 Creating MCP client with enabled servers...",
-                "level": "info"
-            })
-
-            # Create real LangGraph agent with STEALTH mode for demo
-            llm = get_gemini_llm()
-            self.agent = LangGraphAgent(
-                llm=llm,
-                client=client,
-                max_steps=50,
-                stream_display_mode=StreamDisplayMode.STEALTH,  # 🥷 STEALTH mode for demo
-                auto_print_streaming=False,  # We'll capture and send via WebSocket
-                memory_enabled=True,
-                verbose=False
-            )
-
-            await self.send_to_client(websocket, {
-                "type": "log",
-                "message": "🤖 Initializing agent and connecting to MCP servers...",
-                "level": "info"
-            })
+            key = frozenset(enabled_servers)
+            async with self._agent_lock:
+                agent = self._agent_cache.get(key)
+                if agent is not None and not self._agent_is_healthy(agent):
+                    await self._evict_agent(key)
+                    agent = None
+
+            # Connecting can take a while, so it runs outside the lock and
+            # never holds up other clients' starts, resets or disconnects
+            fresh = None
+            if agent is None:
+                fresh = await self._create_agent(websocket, enabled_servers)
+
+            async with self._agent_lock:
+                agent = self._agent_cache.get(key)
+                if agent is not None and not self._agent_is_healthy(agent):
+                    await self._evict_agent(key)
+                    agent = None
+                if agent is None:
+                    agent = fresh
+                    fresh = None
+                    self._agent_cache[key] = agent
+                else:
+                    await self.send_to_client(websocket, {
+                        "type": "log",
+                        "message": "♻️ Reusing initialized agent for these servers",
+                        "level": "info"
+                    })
+
+                # A handed-out agent starts a new conversation: never carry
+                # over a previous client's history (or the secrets in it)
+                agent.clear_conversation_history()
+
+                # Take this client's hold on the agent before dropping its old one,
+                # so restarting with the same servers never closes the agent in use
+                self._agent_refs[key] = self._agent_refs.get(key, 0) + 1
+                await self._release_agent(websocket)
+                self._client_agent_keys[websocket] = key
+                self.agent = agent
+
+            # Another client published an agent for these servers while ours connected
+            if fresh is not None:
+                try:
+                    await fresh.close()
+                except Exception as e:
+                    logger.error(f"Error cleaning up agent: {e}")
 
-            # Initialize the real agent
-            await self.agent.initialize()
+            await self.send_raw(websocket, STATUS_READY)
 
-            await self.send_to_client(websocket, {
-                "type": "log",
-                "message": "✅ Real MCP agent initialized successfully!",
-                "level": "success"
-            })
-
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "ready",
-                "icon": "🟢",
-                "text": "Ready"
-            })
-
-            await self.send_to_client(websocket, {
-                "type": "agent_ready"
-            })
+            await self.send_raw(websocket, AGENT_READY)
 
             self.agent_ready = True
             logger.info("✅ Real MCP agent is ready!")
@@ -158,13 +340,187 @@ class RealMCPWebSocketServer:
                 "message": error_msg
             })
 
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "error",
-                "icon": "🔴",
-                "text": "Error"
+            await self.send_raw(websocket, STATUS_ERROR)
+
+    async def _create_agent(self, websocket, enabled_servers) -> LangGraphAgent:
+        """Build and initialize a LangGraph agent over the enabled servers."""
+        # Create real multi-server client
+        server_selections = {name: True for name in enabled_servers.keys()}
+        client = create_multi_server_client(server_selections)
+
+        await self.send_to_client(websocket, {
+            "type": "log",
+            "message": "🔗 Creating MCP client with enabled servers...",
+            "level": "info"
+        })
+
+        # Create real LangGraph agent with STEALTH mode for demo
+        llm = get_gemini_llm()
+        agent = LangGraphAgent(
+            llm=llm,
+            client=client,
+            max_steps=50,
+            stream_display_mode=StreamDisplayMode.STEALTH,  # 🥷 STEALTH mode for demo
+            auto_print_streaming=False,  # We'll capture and send via WebSocket
+            memory_enabled=True,
+            verbose=False
+        )
+
+        await self.send_to_client(websocket, {
+            "type": "log",
+            "message": "🤖 Initializing agent and connecting to MCP servers...",
+            "level": "info"
+        })
+
+        # Initialize the real agent
+        await agent.initialize()
+
+        await self.send_to_client(websocket, {
+            "type": "log",
+            "message": "✅ Real MCP agent initialized successfully!",
+            "level": "success"
+        })
+        return agent
+
+    @staticmethod
+    def _agent_is_healthy(agent: LangGraphAgent) -> bool:
+        """Whether a cached agent is still initialized with every session connected."""
+        if not getattr(agent, "_initialized", False):
+            return False
+        sessions = getattr(agent.client, "sessions", None) or {}
+        return all(session.is_connected for session in sessions.values())
+
+    async def _evict_agent(self, key: frozenset):
+        """Drop a cached agent regardless of who holds it, and close it."""
+        self._agent_refs.pop(key, None)
+        for client, held in list(self._client_agent_keys.items()):
+            if held == key:
+                del self._client_agent_keys[client]
+        agent = self._agent_cache.pop(key, None)
+        if agent is None:
+            return
+        if agent is self.agent:
+            self.agent = None
+            self.agent_ready = False
+        try:
+            await agent.close()
+        except Exception as e:
+            logger.error(f"Error cleaning up agent: {e}")
+
+    async def _release_agent(self, websocket):
+        """Release this client's hold on its agent, closing it once nobody holds it."""
+        key = self._client_agent_keys.pop(websocket, None)
+        if key is None:
+            return
+        refs = self._agent_refs.get(key, 0) - 1
+        if refs > 0:
+            self._agent_refs[key] = refs
+            return
+        await self._evict_agent(key)
+        logger.info("🧹 Closed agent no longer held by any client")
+
+    async def shutdown(self):
+        """Close every cached agent and stop the MCP servers behind them."""
+        async with self._agent_lock:
+            for key in list(self._agent_cache):
+                await self._evict_agent(key)
+        # Closed agents only park their sessions in the pool; this ends the subprocesses
+        await self.server_manager.shutdown()
+
+    async def _on_tool_call(self, websocket, item: dict, state: StreamState):
+        state.step_count += 1
+        state.tool_execution_count += 1
+        step_count = state.step_count
+        tool_execution_count = state.tool_execution_count
+        send = self.send_to_client
+        tool_name = item.get("tool_name", "unknown")
+
+        # Send STEALTH tool execution step
+        await send(websocket, {
+            "type": "stealth_step",
+            "step_number": step_count,
+            "execution_number": tool_execution_count,
+            "tool_name": tool_name,
+            "tool_input": str(item.get("tool_input", ""))[:200],
+            "message": f"🥷 Step {step_count} - STEALTH TOOL EXECUTION #{tool_execution_count}"
+        })
+
+        await send(websocket, {
+            "type": "log",
+            "message": f"🛠️ STEALTH Tool: {tool_name}",
+            "level": "info"
+        })
+
+    async def _on_tool_result(self, websocket, item: dict, state: StreamState):
+        content = item.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        content_length = len(content)
+        # Only the preview slice is copied, never the whole output
+        content_preview = content[:150] + "..." if content_length > 150 else content
+        content_preview = content_preview.translate(_WS_TABLE)
+        send = self.send_to_client
+
+        # Send STEALTH tool result
+        await send(websocket, {
+            "type": "stealth_result",
+            "step_number": state.step_count,
+            "content_preview": content_preview,
+            "content_length": content_length
+        })
+
+        await send(websocket, {
+            "type": "log",
+            "message": f"✅ STEALTH Output: {content_preview}",
+            "level": "success"
+        })
+
+    async def _on_ai_message(self, websocket, item: dict, state: StreamState):
+        content = item.get("content", "")
+
+        # Handle both string and list content types
+        if isinstance(content, list):
+            # Convert list to string
+            parts = []
+            for item_content in content:
+                if isinstance(item_content, dict):
+                    # Handle structured content (e.g., {"type": "text", "text": "..."})
+                    if item_content.get("type") == "text":
+                        parts.append(item_content.get("text", ""))
+                elif isinstance(item_content, str):
+                    parts.append(item_content)
+            content = "".join(parts)
+        elif not isinstance(content, str):
+            # Convert other types to string
+            content = str(content)
+
+        stripped = content.strip()
+        if len(stripped) > 10:  # Only show substantial AI reasoning
+            content_preview = content[:100] + "..." if len(content) > 100 else content
+            content_preview = content_preview.translate(_WS_TABLE)
+            send = self.send_to_client
+
+            # Send STEALTH AI reasoning
+            await send(websocket, {
+                "type": "stealth_reasoning",
+                "content": content_preview
+            })
+
+            await send(websocket, {
+                "type": "log",
+                "message": f"🤖 STEALTH AI: {content_preview}",
+                "level": "info"
             })
 
+        # Check if this AI message contains the final result
+        if stripped:
+            state.final_result = content
+
+    async def _on_final_result(self, websocket, item: dict, state: StreamState):
+        # Handle explicit final result
+        state.final_result = str(item.get("content", ""))
+        state.done = True
+
     async def handle_execute_query(self, websocket, message: str):
         """Execute real query using MCP agent with STEALTH mode streaming"""
         if not self.agent_ready or not self.agent:
@@ -181,12 +537,7 @@ class RealMCPWebSocketServer:
                 "level": "info"
             })
 
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "busy",
-                "icon": "🟡",
-                "text": "🥷 Stealth Processing..."
-            })
+            await self.send_raw(websocket, STATUS_STEALTH)
 
             # Send STEALTH execution header
             await self.send_to_client(websocket, {
@@ -195,100 +546,26 @@ class RealMCPWebSocketServer:
                 "thread_id": self.agent.thread_id if hasattr(self.agent, 'thread_id') else "stealth-session"
             })
 
+            # Keep the shared conversation thread from growing without bound
+            await prune_memory(self.agent)
+
             # Execute REAL agent streaming with STEALTH mode capture
-            step_count = 0
-            tool_execution_count = 0
-            final_result = ""
+            state = StreamState()
+            # Bound once; the loop body runs for every streamed item
+            handler_for = self._stream_handlers.get
 
             async for item in self.agent.stream(message):
                 # Handle dictionary items (structured responses)
                 if isinstance(item, dict):
-                    if item.get("type") == "tool_call":
-                        step_count += 1
-                        tool_execution_count += 1
-
-                        # Send STEALTH tool execution step
-                        await self.send_to_client(websocket, {
-                            "type": "stealth_step",
-                            "step_number": step_count,
-                            "execution_number": tool_execution_count,
-                            "tool_name": item.get("tool_name", "unknown"),
-                            "tool_input": str(item.get("tool_input", ""))[:200],
-                            "message": f"🥷 Step {step_count} - STEALTH TOOL EXECUTION #{tool_execution_count}"
-                        })
-
-                        await self.send_to_client(websocket, {
-                            "type": "log",
-                            "message": f"🛠️ STEALTH Tool: {item.get('tool_name', 'unknown')}",
-                            "level": "info"
-                        })
-
-                    elif item.get("type") == "tool_result":
-                        content = str(item.get("content", ""))
-                        content_preview = content[:150] + "..." if len(content) > 150 else content
-                        content_preview = content_preview.replace('\n', ' ')
-
-                        # Send STEALTH tool result
-                        await self.send_to_client(websocket, {
-                            "type": "stealth_result",
-                            "step_number": step_count,
-                            "content_preview": content_preview,
-                            "content_length": len(content)
-                        })
-
-                        await self.send_to_client(websocket, {
-                            "type": "log",
-                            "message": f"✅ STEALTH Output: {content_preview}",
-                            "level": "success"
-                        })
-
-                    elif item.get("type") == "ai_message":
-                        content = item.get("content", "")
-
-                        # Handle both string and list content types
-                        if isinstance(content, list):
-                            # Convert list to string
-                            content_str = ""
-                            for item_content in content:
-                                if isinstance(item_content, dict):
-                                    # Handle structured content (e.g., {"type": "text", "text": "..."})
-                                    if item_content.get("type") == "text":
-                                        content_str += item_content.get("text", "")
-                                elif isinstance(item_content, str):
-                                    content_str += item_content
-                            content = content_str
-                        elif not isinstance(content, str):
-                            # Convert other types to string
-                            content = str(content)
-
-                        if content and len(content.strip()) > 10:  # Only show substantial AI reasoning
-                            content_preview = content[:100] + "..." if len(content) > 100 else content
-                            content_preview = content_preview.replace('\n', ' ')
-
-                            # Send STEALTH AI reasoning
-                            await self.send_to_client(websocket, {
-                                "type": "stealth_reasoning",
-                                "content": content_preview
-                            })
-
-                            await self.send_to_client(websocket, {
-                                "type": "log",
-                                "message": f"🤖 STEALTH AI: {content_preview}",
-                                "level": "info"
-                            })
-
-                        # Check if this AI message contains the final result
-                        if content and content.strip():
-                            final_result = content
-
-                    elif item.get("type") == "final_result":
-                        # Handle explicit final result
-                        final_result = str(item.get("content", ""))
-                        break
+                    handler = handler_for(item.get("type"))
+                    if handler is not None:
+                        await handler(websocket, item, state)
+                        if state.done:
+                            break
 
                 # Handle string items (direct results)
                 elif isinstance(item, str):
-                    final_result = item
+                    state.final_result = item
                     break
 
                 # Handle other types
@@ -296,7 +573,11 @@ class RealMCPWebSocketServer:
                     # Convert to string and treat as potential final result
                     result_str = str(item).strip()
                     if result_str and len(result_str) > 10:
-                        final_result = result_str
+                        state.final_result = result_str
+
+            step_count = state.step_count
+            tool_execution_count = state.tool_execution_count
+            final_result = state.final_result
 
             # If we still don't have a final result, try to get it from the agent
             if not final_result or final_result.strip() == "":
@@ -330,12 +611,7 @@ class RealMCPWebSocketServer:
                 "level": "success"
             })
 
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "ready",
-                "icon": "🟢",
-                "text": "Ready"
-            })
+            await self.send_raw(websocket, STATUS_READY)
 
         except Exception as e:
             error_msg = f"STEALTH mission failed: {str(e)}"
@@ -347,12 +623,7 @@ class RealMCPWebSocketServer:
                 "message": error_msg
             })
 
-            await self.send_to_client(websocket, {
-                "type": "status",
-                "status": "ready",
-                "icon": "🟢",
-                "text": "Ready"
-            })
+            await self.send_raw(websocket, STATUS_READY)
 
     async def handle_add_server(self, websocket, data):
         """Handle add server requests using real server manager"""
@@ -389,8 +660,8 @@ class RealMCPWebSocketServer:
                 "level": "warning"
             })
 
-        # Send updated server list
-        await self.send_server_list_update(websocket)
+        # Send updated server list to every client, not just this one
+        await self.broadcast_server_list_update()
 
     async def handle_toggle_server(self, websocket, data):
         """Handle server toggle requests using real server manager"""
@@ -416,8 +687,8 @@ class RealMCPWebSocketServer:
                 "level": "error"
             })
 
-        # Send updated server list
-        await self.send_server_list_update(websocket)
+        # Send updated server list to every client, not just this one
+        await self.broadcast_server_list_update()
 
     async def handle_check_instructions(self, websocket):
         """Handle check instructions requests using real filesystem"""
@@ -471,18 +742,13 @@ class RealMCPWebSocketServer:
             elif message_type == "execute_query":
                 await self.handle_execute_query(websocket, data.get("message", ""))
             elif message_type == "reset_agent":
-                # Reset real agent
-                if self.agent:
-                    await self.agent.close()
+                # Reset real agent; it is closed once no other client still holds it
+                async with self._agent_lock:
+                    await self._release_agent(websocket)
                 self.agent = None
                 self.agent_ready = False
 
-                await self.send_to_client(websocket, {
-                    "type": "status",
-                    "status": "error",
-                    "icon": "🔴",
-                    "text": "Not Ready"
-                })
+                await self.send_raw(websocket, STATUS_NOT_READY)
                 await self.send_to_client(websocket, {
                     "type": "log",
                     "message": "🔄 Real agent reset",
@@ -516,49 +782,85 @@ class RealMCPWebSocketServer:
         """Handle client connection"""
         client_address = websocket.remote_address
         self.connected_clients.add(websocket)
+
+        transport = getattr(websocket, "transport", None)
+        if transport is not None:
+            transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH, low=WRITE_BUFFER_LOW)
+
+        channel = ClientChannel(websocket)
+        self.channels[websocket] = channel
         logger.info(f"Client connected from {client_address}. Total clients: {len(self.connected_clients)}")
 
-        # Send initial status
-        await self.send_to_client(websocket, {
-            "type": "log",
-            "message": "Connected to Real MCP Conductor backend",
-            "level": "success"
-        })
+        try:
+            # The writer and the message loop live and die together: a closed
+            # connection seen by the writer cancels any in-flight handler, and
+            # the writer is cancelled once the client stops sending
+            async with asyncio.TaskGroup() as tg:
+                writer = tg.create_task(channel.run())
+                try:
+                    # Send initial status
+                    await self.send_raw(websocket, CONNECTED_LOG)
 
-        await self.send_to_client(websocket, {
-            "type": "status",
-            "status": "error",
-            "icon": "🔴",
-            "text": "Not Ready"
-        })
+                    await self.send_raw(websocket, STATUS_NOT_READY)
 
-        # Send initial server list
-        await self.send_server_list_update(websocket)
+                    # Send initial server list
+                    await self.send_server_list_update(websocket)
 
-        try:
-            async for message in websocket:
-                await self.handle_message(websocket, message)
-        except websockets.exceptions.ConnectionClosed:
+                    async for message in websocket:
+                        await self.handle_message(websocket, message)
+                finally:
+                    writer.cancel()
+        except* websockets.exceptions.ConnectionClosed:
             logger.info(f"Client {client_address} disconnected normally")
-        except Exception as e:
-            logger.error(f"Error with client {client_address}: {e}")
+        except* Exception as eg:
+            logger.error(f"Error with client {client_address}: {eg.exceptions[0]}")
         finally:
-            # Clean up agent if this was the last client
-            if self.agent and len(self.connected_clients) <= 1:
-                try:
-                    await self.agent.close()
-                    self.agent = None
-                    self.agent_ready = False
-                    logger.info("🧹 Cleaned up agent on last client disconnect")
-                except Exception as e:
-                    logger.error(f"Error cleaning up agent: {e}")
+            # Drop this client's agent hold; the last holder closes the agent
+            async with self._agent_lock:
+                await self._release_agent(websocket)
 
             self.connected_clients.discard(websocket)
+            self.channels.pop(websocket, None)
             logger.info(f"Client {client_address} removed. Total clients: {len(self.connected_clients)}")
 
 
-async def main():
-    """Start the real MCP WebSocket server"""
+def create_listen_sockets(host: str, port: int) -> List[socket.socket]:
+    """Listening sockets with SO_REUSEPORT and TCP keepalive (inherited by accepted clients).
+
+    One socket per address the host resolves to, so ``localhost`` is served
+    on both 127.0.0.1 and ::1 as websockets.serve(host, port) would.
+    """
+    reuse_port = hasattr(socket, "SO_REUSEPORT")
+    sockets = []
+    seen = set()
+    try:
+        for family, _, _, _, sockaddr in socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE):
+            if (family, sockaddr) in seen:
+                continue
+            seen.add((family, sockaddr))
+            sock = socket.create_server(sockaddr, family=family, reuse_port=reuse_port)
+            sockets.append(sock)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # The TCP_KEEP* knobs are platform specific; keep the OS defaults where absent
+            for option, value in (("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+                                  ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                                  ("TCP_KEEPCNT", KEEPALIVE_COUNT)):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    except BaseException:
+        for sock in sockets:
+            sock.close()
+        raise
+    return sockets
+
+
+async def main(ready: Optional[asyncio.Event] = None):
+    """Start the real MCP WebSocket server
+
+    Args:
+        ready: Optional event set once the server is accepting connections
+    """
     server = RealMCPWebSocketServer()
 
     print("🚀 Starting REAL MCP Conductor WebSocket Server")
@@ -569,29 +871,41 @@ async def main():
     print("=" * 60)
 
     try:
-        # Start the server
-        async with websockets.serve(
-                server.handle_client,
-                "localhost",
-                8765,
-                ping_interval=20,
-                ping_timeout=10,
-                close_timeout=10
-        ):
+        # Start the server, one websockets server per listening address
+        async with contextlib.AsyncExitStack() as stack:
+            for sock in create_listen_sockets("localhost", 8765):
+                await stack.enter_async_context(websockets.serve(
+                    server.handle_client,
+                    sock=sock,
+                    ping_interval=20,
+                    ping_timeout=10,
+                    close_timeout=10
+                ))
             print("✅ Real MCP Server started successfully!")
             print("🔗 WebSocket endpoint: ws://localhost:8765")
             print("📊 Waiting for connections...")
             print("🔐 Password Manager ready for demo!")
+            if ready is not None:
+                ready.set()
             await asyncio.Future()  # Run forever
 
     except Exception as e:
         print(f"⌐ Server failed to start: {e}")
         traceback.print_exc()
+    finally:
+        await server.shutdown()
+
+
+def run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n👋 Real MCP Server stopped by user")
     except Exception as e:
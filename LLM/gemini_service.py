@@ -5,23 +5,27 @@ Provides configured Gemini LLM instance for MCP Conductor agents.
 """
 
 import os
+from functools import lru_cache
 from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 
+@lru_cache(maxsize=1)
 def get_gemini_llm():
     """
     Initializes and returns a configured Gemini LLM instance.
 
+    The instance is built once per process and shared by later calls.
+
     Returns:
         ChatGoogleGenerativeAI: Configured Gemini model instance
 
     Raises:
         ValueError: If GOOGLE_API_KEY is not set in environment
     """
+    # Load environment variables (once, since the result is cached)
+    load_dotenv()
+
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import asyncio, sys, os
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from math_tools import AddTool, SubtractTool, MultiplyTool, DivideTool, PowerTool, SqrtTool
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+from math_tools import AddTool, SubtractTool, MultiplyTool, DivideTool, PowerTool, SqrtTool, BatchMathTool
 from langgraph.prebuilt import create_react_agent
 from LLM.gemini_service import get_gemini_llm
 from parser import print_stream, get_user_choice, create_prompt
@@ -11,7 +13,7 @@ async def main():
     print("📚 PHYSICS & CHEMISTRY PROBLEMS")
 
     # Setup
-    tools = [AddTool(), SubtractTool(), MultiplyTool(), DivideTool(), PowerTool(), SqrtTool()]
+    tools = [AddTool(), SubtractTool(), MultiplyTool(), DivideTool(), PowerTool(), SqrtTool(), BatchMathTool()]
     agent = create_react_agent(get_gemini_llm(), tools)
 
     questions = [
@@ -1,45 +1,79 @@
 """
 math_tools.py - Individual Math Operation Tools
 """
+import json
+import logging
+import math
+import operator
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
-from typing import Type
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Optional, Type
+
+log = logging.getLogger("math_tools")
 
 class TwoNumberInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
     a: float = Field(description="First number")
     b: float = Field(description="Second number")
 
 class OneNumberInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
     number: float = Field(description="The number")
 
-class AddTool(BaseTool):
+class MathOp(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    op: str = Field(description="One of: add, subtract, multiply, divide, power, sqrt")
+    a: float = Field(description="First number (the number itself for sqrt)")
+    b: Optional[float] = Field(default=None, description="Second number (not used by sqrt)")
+
+class BatchMathInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    ops: List[MathOp] = Field(description="Independent operations to evaluate in one call")
+
+# One validator per input schema, built at import and reused by every call
+_ADAPTERS = {schema: TypeAdapter(schema) for schema in (TwoNumberInput, OneNumberInput, BatchMathInput)}
+
+class MathTool(BaseTool):
+    """Base for the math tools: dict input is validated by the cached adapter"""
+    def _parse_input(self, tool_input, *args, **kwargs):
+        adapter = _ADAPTERS.get(self.args_schema)
+        if adapter is None or not isinstance(tool_input, dict):
+            return super()._parse_input(tool_input, *args, **kwargs)
+        parsed = adapter.validate_python(tool_input)
+        fields = self.args_schema.model_fields
+        return {key: getattr(parsed, key) for key in tool_input if key in fields}
+
+class AddTool(MathTool):
     name: str = "add"
     description: str = "Add two numbers: a + b"
     args_schema: Type[BaseModel] = TwoNumberInput
     def _run(self, a: float, b: float) -> str:
         result = a + b
-        print(f"🔧 ADD: {a} + {b} = {result}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 ADD: %s + %s = %s", a, b, result)
         return str(result)
 
-class SubtractTool(BaseTool):
+class SubtractTool(MathTool):
     name: str = "subtract"
     description: str = "Subtract: a - b"
     args_schema: Type[BaseModel] = TwoNumberInput
     def _run(self, a: float, b: float) -> str:
         result = a - b
-        print(f"🔧 SUBTRACT: {a} - {b} = {result}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 SUBTRACT: %s - %s = %s", a, b, result)
         return str(result)
 
-class MultiplyTool(BaseTool):
+class MultiplyTool(MathTool):
     name: str = "multiply"
     description: str = "Multiply two numbers: a × b"
     args_schema: Type[BaseModel] = TwoNumberInput
     def _run(self, a: float, b: float) -> str:
         result = a * b
-        print(f"🔧 MULTIPLY: {a} × {b} = {result}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 MULTIPLY: %s × %s = %s", a, b, result)
         return str(result)
 
-class DivideTool(BaseTool):
+class DivideTool(MathTool):
     name: str = "divide"
     description: str = "Divide: a ÷ b"
     args_schema: Type[BaseModel] = TwoNumberInput
@@ -47,35 +81,86 @@ class DivideTool(BaseTool):
         if b == 0:
             return "Error: Division by zero"
         result = a / b
-        print(f"🔧 DIVIDE: {a} ÷ {b} = {result}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 DIVIDE: %s ÷ %s = %s", a, b, result)
         return str(result)
 
-class PowerTool(BaseTool):
+class PowerTool(MathTool):
     name: str = "power"
     description: str = "Power: a ^ b"
     args_schema: Type[BaseModel] = TwoNumberInput
     def _run(self, a: float, b: float) -> str:
-        result = a ** b
-        print(f"🔧 POWER: {a} ^ {b} = {result}")
+        try:
+            result = math.pow(a, b)
+        except ValueError:
+            return "Error: Result is not a real number"
+        except OverflowError:
+            return "Error: Result too large"
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 POWER: %s ^ %s = %s", a, b, result)
         return str(result)
 
-class SqrtTool(BaseTool):
+class SqrtTool(MathTool):
     name: str = "sqrt"
     description: str = "Square root of number"
     args_schema: Type[BaseModel] = OneNumberInput
     def _run(self, number: float) -> str:
         if number < 0:
             return "Error: Negative number"
-        result = number ** 0.5
-        print(f"🔧 SQRT: √{number} = {result}")
+        result = math.sqrt(number)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 SQRT: √%s = %s", number, result)
         return str(result)
 
+_BINARY_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "power": math.pow,
+}
+
+def _eval_op(op: str, a: float, b: Optional[float]):
+    """Evaluate one batch entry, returning an error string like the single tools"""
+    if op == "sqrt":
+        return "Error: Negative number" if a < 0 else math.sqrt(a)
+    if b is None:
+        return f"Error: '{op}' needs two numbers"
+    if op == "divide":
+        return "Error: Division by zero" if b == 0 else a / b
+    func = _BINARY_OPS.get(op)
+    if func is None:
+        return f"Error: Unknown operation '{op}'"
+    try:
+        return func(a, b)
+    except ValueError:
+        return "Error: Result is not a real number"
+    except OverflowError:
+        return "Error: Result too large"
+
+class BatchMathTool(MathTool):
+    name: str = "batch_math"
+    description: str = ("Evaluate several independent operations in one call "
+                        "(add, subtract, multiply, divide, power, sqrt); returns a JSON list of results")
+    args_schema: Type[BaseModel] = BatchMathInput
+    def _run(self, ops: List[MathOp]) -> str:
+        results = []
+        for entry in ops:
+            if isinstance(entry, dict):
+                entry = MathOp(**entry)
+            results.append(_eval_op(entry.op, entry.a, entry.b))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 BATCH: %d ops = %s", len(results), results)
+        return json.dumps(results)
+
 # Test the tools manually
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("🧪 Testing Individual Tools:")
     add = AddTool()
     print(f"5 + 3 = {add._run(5, 3)}")
     multiply = MultiplyTool()
     print(f"4 × 7 = {multiply._run(4, 7)}")
     sqrt = SqrtTool()
-    print(f"√16 = {sqrt._run(16)}")
\ No newline at end of file
+    print(f"√16 = {sqrt._run(16)}")
+    batch = BatchMathTool()
+    print(f"[5 + 3, √16] = {batch._run([{'op': 'add', 'a': 5, 'b': 3}, {'op': 'sqrt', 'a': 16}])}")
\ No newline at end of file
@@ -5,6 +5,41 @@ Message parser and formatter for LangGraph agent outputs
 import json
 import re
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+# Braces only, so the scan in _last_json_object skips everything else
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def _last_json_object(content):
+    """Return the last balanced {...} in content, in one pass over its braces
+
+    Linear even when unbalanced braces pile up:
+
+    >>> _last_json_object('x' + '}' * 100000) is None
+    True
+    >>> _last_json_object('{"a": 1}}')
+    '{"a": 1}'
+    """
+    opens = []
+    last = None
+    for match in _BRACE_RE.finditer(content):
+        if match.group() == '{':
+            opens.append(match.start())
+        elif opens:
+            last = (opens.pop(), match.end())
+    return None if last is None else content[last[0]:last[1]]
+
+
+def _pretty_json(text):
+    """Parse a JSON object and re-render it with a 2-space indent"""
+    if orjson:
+        return orjson.dumps(orjson.loads(text), option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(json.loads(text), indent=2)
+
 
 def format_json_content(content):
     """Format JSON content nicely - show only the latest JSON"""
@@ -13,19 +48,14 @@ def format_json_content(content):
 
     content = content.replace('```json\n', '').replace('```', '').strip()
 
-    if '{' in content and '}' in content:
-        json_objects = re.findall(r'\{[^}]*\}', content)
-        if json_objects:
-            latest_json = json_objects[-1]
-            try:
-                parsed = json.loads(latest_json)
-                formatted = json.dumps(parsed, indent=2)
-                print(f"📋 JSON:")
-                print(f"   {formatted}")
-            except:
-                print(f"📋 JSON: {latest_json}")
-        else:
-            print(f"🧠 THINKING: {content}")
+    latest_json = _last_json_object(content)
+    if latest_json is not None:
+        try:
+            formatted = _pretty_json(latest_json)
+            print(f"📋 JSON:")
+            print(f"   {formatted}")
+        except:
+            print(f"📋 JSON: {latest_json}")
     else:
         print(f"🧠 THINKING: {content}")
 
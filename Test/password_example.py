@@ -6,23 +6,118 @@ Quick example showing how to use the custom password manager MCP server.
 """
 
 import asyncio
+import copy
+import secrets
+import string
 import sys
+import uuid
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (once, even if re-imported)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
-from Agent import get_multi_server_agent
-from Client import add_custom_server, get_server_manager, create_multi_server_client
-from Custom import add_password_server, setup_password_server
-from LLM import get_gemini_llm
-from mcp_conductor import LangGraphAgent, StreamDisplayMode
+from Agent import close_cached_agents, get_or_create_agent
+from Client import get_server_manager
+from Custom import setup_password_server
+
+
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*"
+
+
+def generate_password(length):
+    """Random password built locally, so saving it takes one tool call, not two."""
+    return "".join(secrets.choice(PASSWORD_ALPHABET) for _ in range(length))
+
+
+# (name, title, query, preview length, names of tests that must finish first)
+TESTS = [
+    ("generate", "🔑 Test 1: Generate a secure password",
+     "Generate a 16-character password with symbols", 100, ()),
+    ("save_gmail", "💾 Test 2: Save a password for a service", """
+            Save a password for Gmail with:
+            - Service: Gmail
+            - Username: demo@example.com  
+            - Password: MySecurePassword123!
+            - URL: https://gmail.com
+            - Notes: Personal email account
+            """, 100, ()),
+    ("get_gmail", "🔓 Test 3: Retrieve the Gmail password",
+     "Get the password for Gmail", 200, ("save_gmail",)),
+    ("update_gmail", "🔄 Test 4: Update the Gmail password",
+     "Update the Gmail password to 'NewSecurePassword456!' and change notes to 'Updated password'", 200,
+     ("save_gmail", "get_gmail")),
+    ("save_github", "🔑 Test 5: Save a freshly generated GitHub password", f"""
+            Save a password for GitHub with:
+            - Service: GitHub
+            - Username: myuser
+            - Password: {generate_password(20)}
+            - URL: https://github.com
+            - Notes: Development account
+            """, 200, ()),
+    ("list", "📋 Test 6: List all saved passwords",
+     "List all my saved passwords", 200, ("save_github", "update_gmail")),
+]
+
+
+def branch_agent(agent):
+    """Shallow copy of an initialized agent on its own conversation thread.
+
+    The copy shares the MCP client, tools and compiled graph, so concurrent
+    runs don't pay for new sessions, but each keeps a separate memory thread.
+    Streaming output is off: any branch may overlap another, and interleaved
+    RICH output would be unreadable, so results are printed by run_tests.
+    """
+    branch = copy.copy(agent)
+    branch.thread_id = str(uuid.uuid4())
+    branch.auto_print_streaming = False
+    return branch
+
+
+async def run_tests(agent):
+    """Run TESTS concurrently, each starting as soon as its dependencies finish.
+
+    A test is launched the moment its last dependency completes rather than
+    when a whole layer does, so e.g. the Gmail lookup overlaps the GitHub
+    save. The list runs last, after every change to the store, so its output
+    is the same on every run. Each result is printed whole as its test
+    finishes.
+    """
+    tests = {test[0]: test for test in TESTS}
+    pending = {}
+    results = {}
+
+    def launch_ready():
+        ready = [test for test in TESTS
+                 if test[0] not in pending and test[0] not in results and set(test[4]) <= results.keys()]
+        for name, title, query, preview, deps in ready:
+            pending[name] = asyncio.create_task(branch_agent(agent).run(query))
+        if len(ready) > 1:
+            print(f"\n⚡ Running in parallel: {', '.join(test[0] for test in ready)}")
+
+    try:
+        launch_ready()
+        while pending:
+            finished, _ = await asyncio.wait(pending.values(), return_when=asyncio.FIRST_COMPLETED)
+            for name, task in list(pending.items()):
+                if task in finished:
+                    results[name] = task.result()
+                    del pending[name]
+                    _, title, _, preview, _ = tests[name]
+                    print(f"\n{title}\nResult: {results[name][:preview]}...")
+            launch_ready()
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+    if len(results) < len(TESTS):
+        raise ValueError(f"Dependency cycle among tests: {[test[0] for test in TESTS if test[0] not in results]}")
 
 
 async def main():
     """Demo the password manager functionality."""
-    print("🔐 Password Manager MCP Server Demo")
-    print("=" * 50)
+    print("🔐 Password Manager MCP Server Demo\n" + "=" * 50)
 
     # Step 1: Add password server
     print("📦 Step 1: Adding password manager server...")
@@ -33,115 +128,71 @@ async def main():
     print("📁 Step 2: Enabling filesystem server...")
     manager = get_server_manager()
     manager.enable_server("filesystem")
-    print("✅ Filesystem server enabled")
-    print()
+    print("✅ Filesystem server enabled\n")
 
-    # Step 3: Create client with selected servers
-    print("🔗 Step 3: Creating multi-server client...")
+    # Step 3: Select servers for the multi-server client
+    print("🔗 Step 3: Selecting servers for the multi-server client...")
     server_selections = {
         "filesystem": True,
         "password_manager": True
     }
-    client = create_multi_server_client(server_selections)
-    print("✅ Client created with filesystem + password manager")
-    print()
+    print("✅ Filesystem + password manager selected\n")
 
-    # Step 4: Create agent
+    # Step 4: Get the shared agent (sessions are reused within this process)
     print("🤖 Step 4: Creating agent...")
-    llm = get_gemini_llm()
-
-    agent = LangGraphAgent(
-        llm=llm,
-        client=client,
-        max_steps=20,
-        stream_display_mode=StreamDisplayMode.RICH,
-        auto_print_streaming=True,
-        memory_enabled=True
-    )
-    print("✅ Agent created with RICH display")
-    print()
+    try:
+        agent = await get_or_create_agent(server_selections, max_steps=20)
+    except Exception as e:
+        print(f"❌ Failed to start servers or LLM: {e}")
+        return
+    print("✅ Agent created with RICH display\n")
 
     # Step 5: Demo password management workflow
-    print("🎯 Step 5: Testing password management workflow...")
-    print("=" * 50)
+    print("🎯 Step 5: Testing password management workflow...\n" + "=" * 50)
 
     try:
-        async with agent:
-            # Test 1: Generate a password
-            print("\n🔑 Test 1: Generate a secure password")
-            result1 = await agent.run("Generate a 16-character password with symbols")
-            print(f"Result: {result1[:100]}...")
-
-            # Test 2: Save a password (YES, we ARE testing save here!)
-            print("\n💾 Test 2: Save a password for a service")
-            result2 = await agent.run("""
-            Save a password for Gmail with:
-            - Service: Gmail
-            - Username: demo@example.com  
-            - Password: MySecurePassword123!
-            - URL: https://gmail.com
-            - Notes: Personal email account
-            """)
-            print(f"Result: {result2[:100]}...")
-
-            # Test 3: List saved passwords
-            print("\n📋 Test 3: List all saved passwords")
-            result3 = await agent.run("List all my saved passwords")
-            print(f"Result: {result3[:200]}...")
-
-            # Test 4: Retrieve a password
-            print("\n🔓 Test 4: Retrieve the Gmail password")
-            result4 = await agent.run("Get the password for Gmail")
-            print(f"Result: {result4[:200]}...")
-
-            # Test 5: Update a password
-            print("\n🔄 Test 5: Update the Gmail password")
-            result5 = await agent.run(
-                "Update the Gmail password to 'NewSecurePassword456!' and change notes to 'Updated password'")
-            print(f"Result: {result5[:200]}...")
-
-            # Test 6: Generate and save another password
-            print("\n🔑 Test 6: Generate and save a GitHub password")
-            result6 = await agent.run("""
-            First generate a 20-character password with symbols, then save it for GitHub with:
-            - Service: GitHub
-            - Username: myuser
-            - URL: https://github.com
-            - Notes: Development account
-            """)
-            print(f"Result: {result6[:200]}...")
+        await run_tests(agent)
 
-            # Small delay to help with cleanup
-            print("\n⏳ Allowing cleanup time...")
-            await asyncio.sleep(1)
+        # Small delay to help with cleanup
+        print("\n⏳ Allowing cleanup time...")
+        await asyncio.sleep(1)
 
     except Exception as e:
         print(f"❌ Error during demo: {e}")
 
-    print("\n✅ Password manager demo completed!")
-    print("\n🔐 What we tested:")
-    print("   ✅ Generate secure passwords")
-    print("   ✅ Save passwords with metadata")
-    print("   ✅ List all saved passwords")
-    print("   ✅ Retrieve specific passwords")
-    print("   ✅ Update existing passwords")
-    print("   ✅ Generate and save in one step")
-
-    print("\n💡 Try these commands in the web demo:")
-    print("   - 'Generate a 20-character password with symbols'")
-    print("   - 'Save a password for GitHub with username myuser'")
-    print("   - 'List all my saved passwords'")
-    print("   - 'Get the password for GitHub'")
-    print("   - 'Delete the password for Gmail'")
-    print("   - 'Update the GitHub password'")
+    print("\n".join([
+        "\n✅ Password manager demo completed!",
+        "\n🔐 What we tested:",
+        "   ✅ Generate secure passwords",
+        "   ✅ Save passwords with metadata",
+        "   ✅ List all saved passwords",
+        "   ✅ Retrieve specific passwords",
+        "   ✅ Update existing passwords",
+        "   ✅ Save a locally generated password",
+        "\n💡 Try these commands in the web demo:",
+        "   - 'Generate a 20-character password with symbols'",
+        "   - 'Save a password for GitHub with username myuser'",
+        "   - 'List all my saved passwords'",
+        "   - 'Get the password for GitHub'",
+        "   - 'Delete the password for Gmail'",
+        "   - 'Update the GitHub password'",
+    ]))
 
     # Final delay to help with subprocess cleanup
     await asyncio.sleep(0.5)
 
 
+async def run_standalone():
+    """Run main, then shut down the shared agent's MCP servers."""
+    try:
+        await main()
+    finally:
+        await close_cached_agents()
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(run_standalone())
     except KeyboardInterrupt:
         print("\n👋 Demo interrupted by user")
     except Exception as e: